@@ -0,0 +1,33 @@
+from fastapi import Request
+
+from app.services.market_data import MarketDataService, MarketDataBatcher
+from app.services.strategy_service import StrategyService
+from app.services.forecast_service import ForecastService
+from app.services.backtest_service import BacktestService
+from app.services.news_service import NewsService
+from app.services.export_service import ExportService
+
+# Dependency accessors for the service singletons created in main.py's
+# lifespan. Each request reuses the warm instance on app.state instead of
+# re-running service __init__ (sessions, caches, style sheets) per call.
+
+def get_market_service(request: Request) -> MarketDataService:
+    return request.app.state.market_service
+
+def get_market_batcher(request: Request) -> MarketDataBatcher:
+    return request.app.state.market_batcher
+
+def get_strategy_service(request: Request) -> StrategyService:
+    return request.app.state.strategy_service
+
+def get_forecast_service(request: Request) -> ForecastService:
+    return request.app.state.forecast_service
+
+def get_backtest_service(request: Request) -> BacktestService:
+    return request.app.state.backtest_service
+
+def get_news_service(request: Request) -> NewsService:
+    return request.app.state.news_service
+
+def get_export_service(request: Request) -> ExportService:
+    return request.app.state.export_service
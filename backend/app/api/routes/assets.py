@@ -1,33 +1,42 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi_cache.decorator import cache
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.services.market_data import MarketDataService
-from app.models.schemas import Asset, AssetSearch
-import yfinance as yf
-import asyncio
+import hashlib
+import orjson
+from app.api.deps import get_market_service, get_market_batcher
+from app.core.cache import query_key_builder
+from app.core.ratelimit import limiter
+from app.core.singleflight import singleflight
+from app.services.market_data import MarketDataService, MarketDataBatcher
+from app.models.schemas import Asset
 
 router = APIRouter()
 
 @router.get("/search", response_model=List[Asset])
 async def search_assets(
     q: str = Query(..., min_length=1, description="Search query"),
-    limit: int = Query(20, ge=1, le=100, description="Maximum number of results")
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    market_service: MarketDataService = Depends(get_market_service)
 ):
     """Search for assets (stocks, crypto, futures, options)"""
     try:
-        market_service = MarketDataService()
         results = await market_service.search_assets(q, limit)
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 @router.get("/{symbol}", response_model=Asset)
-async def get_asset_info(symbol: str):
+@limiter.limit("8/minute")  # ticker.info is the scarcest yfinance quota
+async def get_asset_info(
+    request: Request,
+    symbol: str,
+    market_service: MarketDataService = Depends(get_market_service)
+):
     """Get detailed information about a specific asset"""
     try:
-        market_service = MarketDataService()
-        asset_info = await market_service.get_asset_info(symbol)
+        asset_info = await singleflight.do(
+            f"info:{symbol}", lambda: market_service.get_asset_info(symbol)
+        )
         if not asset_info:
             raise HTTPException(status_code=404, detail="Asset not found")
         return asset_info
@@ -37,11 +46,16 @@ async def get_asset_info(symbol: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch asset info: {str(e)}")
 
 @router.get("/{symbol}/market-data")
-async def get_market_data(symbol: str):
+@cache(expire=30, key_builder=query_key_builder)
+async def get_market_data(
+    symbol: str,
+    market_batcher: MarketDataBatcher = Depends(get_market_batcher)
+):
     """Get current market data for an asset"""
     try:
-        market_service = MarketDataService()
-        market_data = await market_service.get_market_data(symbol)
+        market_data = await singleflight.do(
+            f"market:{symbol}", lambda: market_batcher.get_market_data(symbol)
+        )
         if not market_data:
             raise HTTPException(status_code=404, detail="Market data not found")
         return market_data
@@ -50,19 +64,33 @@ async def get_market_data(symbol: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch market data: {str(e)}")
 
+# Static content: serialized once at import so each hit returns cached
+# bytes instead of rebuilding the list and re-encoding it
+_POPULAR_ASSETS_JSON = orjson.dumps([
+    {"symbol": "AAPL", "name": "Apple Inc.", "type": "stock", "exchange": "NASDAQ"},
+    {"symbol": "TSLA", "name": "Tesla Inc.", "type": "stock", "exchange": "NASDAQ"},
+    {"symbol": "MSFT", "name": "Microsoft Corp.", "type": "stock", "exchange": "NASDAQ"},
+    {"symbol": "GOOGL", "name": "Alphabet Inc.", "type": "stock", "exchange": "NASDAQ"},
+    {"symbol": "AMZN", "name": "Amazon.com Inc.", "type": "stock", "exchange": "NASDAQ"},
+    {"symbol": "BTC-USD", "name": "Bitcoin", "type": "crypto"},
+    {"symbol": "ETH-USD", "name": "Ethereum", "type": "crypto"},
+    {"symbol": "GC=F", "name": "Gold Futures", "type": "future"},
+    {"symbol": "CL=F", "name": "Crude Oil Futures", "type": "future"},
+    {"symbol": "ES=F", "name": "S&P 500 Futures", "type": "future"},
+])
+# Quoted to match the ETag format the middleware emits and clients echo
+_POPULAR_ASSETS_ETAG = f'"{hashlib.md5(_POPULAR_ASSETS_JSON).hexdigest()}"'
+
 @router.get("/popular/list")
-async def get_popular_assets():
+async def get_popular_assets(request: Request):
     """Get list of popular/trending assets"""
-    popular_assets = [
-        {"symbol": "AAPL", "name": "Apple Inc.", "type": "stock", "exchange": "NASDAQ"},
-        {"symbol": "TSLA", "name": "Tesla Inc.", "type": "stock", "exchange": "NASDAQ"},
-        {"symbol": "MSFT", "name": "Microsoft Corp.", "type": "stock", "exchange": "NASDAQ"},
-        {"symbol": "GOOGL", "name": "Alphabet Inc.", "type": "stock", "exchange": "NASDAQ"},
-        {"symbol": "AMZN", "name": "Amazon.com Inc.", "type": "stock", "exchange": "NASDAQ"},
-        {"symbol": "BTC-USD", "name": "Bitcoin", "type": "crypto"},
-        {"symbol": "ETH-USD", "name": "Ethereum", "type": "crypto"},
-        {"symbol": "GC=F", "name": "Gold Futures", "type": "future"},
-        {"symbol": "CL=F", "name": "Crude Oil Futures", "type": "future"},
-        {"symbol": "ES=F", "name": "S&P 500 Futures", "type": "future"},
-    ]
-    return popular_assets
+    # The ETag middleware skips responses that already carry one, so the
+    # conditional check lives here: a matching If-None-Match costs a 304
+    # with no body instead of re-sending the (static) payload
+    if request.headers.get("if-none-match") == _POPULAR_ASSETS_ETAG:
+        return Response(status_code=304, headers={"ETag": _POPULAR_ASSETS_ETAG})
+    return Response(
+        content=_POPULAR_ASSETS_JSON,
+        media_type="application/json",
+        headers={"ETag": _POPULAR_ASSETS_ETAG}
+    )
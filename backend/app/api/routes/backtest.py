@@ -1,9 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from datetime import datetime
+from app.api.deps import get_backtest_service
 from app.services.backtest_service import BacktestService
 from app.models.schemas import BacktestResult
-import asyncio
 
 router = APIRouter()
 
@@ -17,10 +17,12 @@ class BacktestRequest(BaseModel):
     slippage: float = 0.0005   # 0.05%
 
 @router.post("/", response_model=BacktestResult)
-async def run_backtest(request: BacktestRequest):
+async def run_backtest(
+    request: BacktestRequest,
+    backtest_service: BacktestService = Depends(get_backtest_service)
+):
     """Run backtest for a strategy on historical data"""
     try:
-        backtest_service = BacktestService()
         result = await backtest_service.run_backtest(
             symbol=request.symbol,
             strategy_id=request.strategy_id,
@@ -42,20 +44,25 @@ async def run_backtest(request: BacktestRequest):
         raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
 
 @router.get("/history/{symbol}")
-async def get_backtest_history(symbol: str, limit: int = 10):
+async def get_backtest_history(
+    symbol: str,
+    limit: int = 10,
+    backtest_service: BacktestService = Depends(get_backtest_service)
+):
     """Get historical backtest results for an asset"""
     try:
-        backtest_service = BacktestService()
         history = await backtest_service.get_backtest_history(symbol, limit)
         return history
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch backtest history: {str(e)}")
 
 @router.get("/performance/{backtest_id}")
-async def get_backtest_performance(backtest_id: str):
+async def get_backtest_performance(
+    backtest_id: str,
+    backtest_service: BacktestService = Depends(get_backtest_service)
+):
     """Get detailed performance metrics for a backtest"""
     try:
-        backtest_service = BacktestService()
         performance = await backtest_service.get_performance_metrics(backtest_id)
         
         if not performance:
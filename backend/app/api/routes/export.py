@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Any, Dict
+from app.api.deps import get_export_service
 from app.services.export_service import ExportService
 import asyncio
+import io
 
 router = APIRouter()
 
@@ -11,48 +14,52 @@ class ExportRequest(BaseModel):
     type: str  # 'forecast' or 'backtest'
 
 @router.post("/pdf")
-async def export_to_pdf(request: ExportRequest):
+async def export_to_pdf(
+    request: ExportRequest,
+    export_service: ExportService = Depends(get_export_service)
+):
     """Export data to PDF format"""
     try:
-        export_service = ExportService()
-        pdf_content = await export_service.export_to_pdf(
-            data=request.data,
-            export_type=request.type
+        # Rendering happens in a worker thread (reportlab is CPU-bound);
+        # the finished document is streamed out chunk by chunk
+        pdf_content = await asyncio.to_thread(
+            export_service.render_pdf, request.data, request.type
         )
-        
-        return Response(
-            content=pdf_content,
+
+        return StreamingResponse(
+            io.BytesIO(pdf_content),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={request.type}_report.pdf"}
         )
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
 
 @router.post("/csv")
-async def export_to_csv(request: ExportRequest):
+async def export_to_csv(
+    request: ExportRequest,
+    export_service: ExportService = Depends(get_export_service)
+):
     """Export data to CSV format"""
     try:
-        export_service = ExportService()
-        csv_content = await export_service.export_to_csv(
-            data=request.data,
-            export_type=request.type
-        )
-        
-        return Response(
-            content=csv_content,
+        # Stream rows as they are formatted instead of materializing the
+        # whole document; keeps memory flat for large trade logs
+        return StreamingResponse(
+            export_service.iter_csv_rows(request.data, request.type),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={request.type}_data.csv"}
         )
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"CSV export failed: {str(e)}")
 
 @router.post("/summary")
-async def generate_summary(request: ExportRequest):
+async def generate_summary(
+    request: ExportRequest,
+    export_service: ExportService = Depends(get_export_service)
+):
     """Generate a shareable text summary"""
     try:
-        export_service = ExportService()
         summary = await export_service.generate_summary(
             data=request.data,
             export_type=request.type
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List
+from app.api.deps import get_forecast_service
 from app.services.forecast_service import ForecastService
 from app.models.schemas import ForecastResult, TimeFrame
-import asyncio
 
 router = APIRouter()
 
@@ -18,10 +18,12 @@ class BatchForecastRequest(BaseModel):
     timeframe: TimeFrame = "1d"
 
 @router.post("/", response_model=ForecastResult)
-async def generate_forecast(request: ForecastRequest):
+async def generate_forecast(
+    request: ForecastRequest,
+    forecast_service: ForecastService = Depends(get_forecast_service)
+):
     """Generate forecast for a specific strategy and asset"""
     try:
-        forecast_service = ForecastService()
         forecast = await forecast_service.generate_forecast(
             symbol=request.symbol,
             strategy_id=request.strategy_id,
@@ -39,27 +41,32 @@ async def generate_forecast(request: ForecastRequest):
         raise HTTPException(status_code=500, detail=f"Forecast generation failed: {str(e)}")
 
 @router.post("/batch", response_model=List[ForecastResult])
-async def batch_forecast(request: BatchForecastRequest):
+async def batch_forecast(
+    request: BatchForecastRequest,
+    forecast_service: ForecastService = Depends(get_forecast_service)
+):
     """Generate forecasts for multiple strategies on the same asset"""
     try:
-        forecast_service = ForecastService()
-        forecasts = await forecast_service.batch_forecast(
+        # The service fetches the bars once, derives indicators from them
+        # and scores every strategy concurrently under a semaphore
+        return await forecast_service.batch_forecast(
             symbol=request.symbol,
             strategy_ids=request.strategy_ids,
             timeframe=request.timeframe
         )
-        
-        return forecasts
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch forecast failed: {str(e)}")
 
 @router.get("/history/{symbol}")
-async def get_forecast_history(symbol: str, limit: int = 10):
+async def get_forecast_history(
+    symbol: str,
+    limit: int = 10,
+    forecast_service: ForecastService = Depends(get_forecast_service)
+):
     """Get historical forecasts for an asset"""
     try:
-        forecast_service = ForecastService()
-        history = await forecast_service.get_forecast_history(symbol, limit)
+        history = forecast_service.get_forecast_history(symbol, limit)
         return history
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch forecast history: {str(e)}")
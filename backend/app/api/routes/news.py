@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi_cache.decorator import cache
 from typing import List, Optional
+from app.api.deps import get_news_service
+from app.core.cache import query_key_builder
+from app.core.config import settings
 from app.services.news_service import NewsService
 from app.models.schemas import NewsItem
-import asyncio
 
 router = APIRouter()
 
@@ -10,11 +13,11 @@ router = APIRouter()
 async def get_news(
     symbol: Optional[str] = Query(None, description="Filter by asset symbol"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of articles"),
-    sentiment: Optional[str] = Query(None, description="Filter by sentiment")
+    sentiment: Optional[str] = Query(None, description="Filter by sentiment"),
+    news_service: NewsService = Depends(get_news_service)
 ):
     """Get financial news"""
     try:
-        news_service = NewsService()
         news = await news_service.get_news(
             symbol=symbol,
             limit=limit,
@@ -25,22 +28,37 @@ async def get_news(
         raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
 
 @router.get("/market", response_model=List[NewsItem])
+@cache(expire=settings.CACHE_TTL, key_builder=query_key_builder)
 async def get_market_news(
-    limit: int = Query(10, ge=1, le=50, description="Maximum number of articles")
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of articles"),
+    news_service: NewsService = Depends(get_news_service)
 ):
     """Get general market news"""
     try:
-        news_service = NewsService()
         news = await news_service.get_market_news(limit=limit)
         return news
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch market news: {str(e)}")
 
+@router.get("/sentiment")
+async def get_sentiment_analysis_batch(
+    symbols: str = Query(..., description="Comma-separated asset symbols"),
+    news_service: NewsService = Depends(get_news_service)
+):
+    """Get sentiment analysis for several assets in one request"""
+    try:
+        requested = [s.strip() for s in symbols.split(",") if s.strip()]
+        return await news_service.get_sentiment_analysis_batch(requested)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to analyze sentiment: {str(e)}")
+
 @router.get("/sentiment/{symbol}")
-async def get_sentiment_analysis(symbol: str):
+async def get_sentiment_analysis(
+    symbol: str,
+    news_service: NewsService = Depends(get_news_service)
+):
     """Get sentiment analysis for a specific asset"""
     try:
-        news_service = NewsService()
         sentiment = await news_service.get_sentiment_analysis(symbol)
         
         if not sentiment:
@@ -53,10 +71,12 @@ async def get_sentiment_analysis(symbol: str):
         raise HTTPException(status_code=500, detail=f"Failed to analyze sentiment: {str(e)}")
 
 @router.get("/trending")
-async def get_trending_news():
+@cache(expire=settings.CACHE_TTL, key_builder=query_key_builder)
+async def get_trending_news(
+    news_service: NewsService = Depends(get_news_service)
+):
     """Get trending financial news"""
     try:
-        news_service = NewsService()
         trending = await news_service.get_trending_news()
         return trending
     except Exception as e:
@@ -1,41 +1,88 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
-from datetime import datetime, timedelta
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi_cache.decorator import cache
+from typing import Dict, Final, List, Optional
+from datetime import datetime
+from app.api.deps import get_market_service
+from app.core.cache import query_key_builder
+from app.core.ratelimit import limiter
+from app.core.singleflight import singleflight
 from app.services.market_data import MarketDataService
 from app.models.schemas import PriceData, TimeFrame
-import asyncio
 
 router = APIRouter()
 
-@router.get("/{symbol}/historical", response_model=List[PriceData])
+# Default yfinance period per timeframe, built once at import instead of
+# per request
+PERIOD_MAP: Final[Dict[str, str]] = {
+    "1h": "5d",
+    "4h": "1mo",
+    "1d": "1y",
+    "1w": "2y",
+    "1M": "5y",
+    "3M": "max",
+    "6M": "max",
+    "1Y": "max",
+    "3Y": "max",
+    "5Y": "max",
+    "YTD": "ytd"
+}
+
+# Declared before the /{symbol} routes so the literal path wins
+@router.get(
+    "/batch/historical",
+    response_model=None,
+    responses={200: {"model": Dict[str, List[PriceData]]}}
+)
+@cache(expire=300, key_builder=query_key_builder)
+async def get_historical_data_batch(
+    symbols: str = Query(..., description="Comma-separated asset symbols"),
+    timeframe: TimeFrame = Query("1d", description="Timeframe for data"),
+    period: Optional[str] = Query(None, description="Period (e.g., '1y', '6mo', '3mo')"),
+    market_service: MarketDataService = Depends(get_market_service)
+):
+    """Get historical price data for several assets in one request"""
+    try:
+        requested = [s.strip() for s in symbols.split(",") if s.strip()]
+        if not requested:
+            raise HTTPException(status_code=400, detail="No symbols provided")
+
+        if not period:
+            period = PERIOD_MAP.get(timeframe, "1y")
+
+        return await market_service.get_historical_data_batch(
+            symbols=requested,
+            timeframe=timeframe,
+            period=period
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch historical data: {str(e)}")
+
+# response_model=None: the service already produces coerced PriceData via
+# model_construct, so FastAPI re-validating ~250-1300 rows per call would be
+# pure overhead. The schema stays in OpenAPI through `responses`.
+@router.get(
+    "/{symbol}/historical",
+    response_model=None,
+    responses={200: {"model": List[PriceData]}}
+)
+@cache(expire=300, key_builder=query_key_builder)
 async def get_historical_data(
     symbol: str,
     timeframe: TimeFrame = Query("1d", description="Timeframe for data"),
     period: Optional[str] = Query(None, description="Period (e.g., '1y', '6mo', '3mo')"),
     start_date: Optional[datetime] = Query(None, description="Start date"),
-    end_date: Optional[datetime] = Query(None, description="End date")
+    end_date: Optional[datetime] = Query(None, description="End date"),
+    market_service: MarketDataService = Depends(get_market_service)
 ):
     """Get historical price data for an asset"""
     try:
-        market_service = MarketDataService()
-        
         # Determine period if not provided
         if not period and not start_date:
-            period_map = {
-                "1h": "5d",
-                "4h": "1mo", 
-                "1d": "1y",
-                "1w": "2y",
-                "1M": "5y",
-                "3M": "max",
-                "6M": "max",
-                "1Y": "max",
-                "3Y": "max",
-                "5Y": "max",
-                "YTD": "ytd"
-            }
-            period = period_map.get(timeframe, "1y")
-        
+            period = PERIOD_MAP.get(timeframe, "1y")
+
         price_data = await market_service.get_historical_data(
             symbol=symbol,
             timeframe=timeframe,
@@ -54,12 +101,23 @@ async def get_historical_data(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch historical data: {str(e)}")
 
-@router.get("/{symbol}/realtime", response_model=PriceData)
-async def get_realtime_data(symbol: str):
+@router.get(
+    "/{symbol}/realtime",
+    response_model=None,
+    responses={200: {"model": PriceData}}
+)
+@cache(expire=30, key_builder=query_key_builder)
+@limiter.limit("50/minute")  # cache hits bypass the limiter; only misses hit Yahoo
+async def get_realtime_data(
+    request: Request,
+    symbol: str,
+    market_service: MarketDataService = Depends(get_market_service)
+):
     """Get real-time price data for an asset"""
     try:
-        market_service = MarketDataService()
-        realtime_data = await market_service.get_realtime_data(symbol)
+        realtime_data = await singleflight.do(
+            f"realtime:{symbol}", lambda: market_service.get_realtime_data(symbol)
+        )
         
         if not realtime_data:
             raise HTTPException(status_code=404, detail="No real-time data found")
@@ -72,14 +130,15 @@ async def get_realtime_data(symbol: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch real-time data: {str(e)}")
 
 @router.get("/{symbol}/indicators")
+@cache(expire=300, key_builder=query_key_builder)
 async def get_technical_indicators(
     symbol: str,
     timeframe: TimeFrame = Query("1d", description="Timeframe for indicators"),
-    period: Optional[str] = Query("1y", description="Period for calculation")
+    period: Optional[str] = Query("1y", description="Period for calculation"),
+    market_service: MarketDataService = Depends(get_market_service)
 ):
     """Get technical indicators for an asset"""
     try:
-        market_service = MarketDataService()
         indicators = await market_service.get_technical_indicators(symbol, timeframe, period)
         
         if not indicators:
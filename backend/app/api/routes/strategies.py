@@ -1,8 +1,8 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
+from app.api.deps import get_strategy_service
 from app.services.strategy_service import StrategyService
 from app.models.schemas import Strategy
-import asyncio
 
 router = APIRouter()
 
@@ -10,11 +10,11 @@ router = APIRouter()
 async def get_strategies(
     asset_type: Optional[str] = Query(None, description="Filter by asset type"),
     risk_level: Optional[str] = Query(None, description="Filter by risk level"),
-    category: Optional[str] = Query(None, description="Filter by strategy category")
+    category: Optional[str] = Query(None, description="Filter by strategy category"),
+    strategy_service: StrategyService = Depends(get_strategy_service)
 ):
     """Get available trading strategies"""
     try:
-        strategy_service = StrategyService()
         strategies = await strategy_service.get_strategies(
             asset_type=asset_type,
             risk_level=risk_level,
@@ -25,10 +25,12 @@ async def get_strategies(
         raise HTTPException(status_code=500, detail=f"Failed to fetch strategies: {str(e)}")
 
 @router.get("/{strategy_id}", response_model=Strategy)
-async def get_strategy(strategy_id: str):
+async def get_strategy(
+    strategy_id: str,
+    strategy_service: StrategyService = Depends(get_strategy_service)
+):
     """Get detailed information about a specific strategy"""
     try:
-        strategy_service = StrategyService()
         strategy = await strategy_service.get_strategy(strategy_id)
         
         if not strategy:
@@ -41,10 +43,12 @@ async def get_strategy(strategy_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch strategy: {str(e)}")
 
 @router.get("/compatible/{symbol}")
-async def get_compatible_strategies(symbol: str):
+async def get_compatible_strategies(
+    symbol: str,
+    strategy_service: StrategyService = Depends(get_strategy_service)
+):
     """Get strategies compatible with a specific asset"""
     try:
-        strategy_service = StrategyService()
         strategies = await strategy_service.get_compatible_strategies(symbol)
         return strategies
     except Exception as e:
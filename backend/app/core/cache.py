@@ -0,0 +1,45 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+_redis: Optional[aioredis.Redis] = None
+
+def get_redis() -> aioredis.Redis:
+    """Lazily-created shared Redis connection for service-level caches"""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+    return _redis
+
+def query_key_builder(
+    func: Callable,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: dict = None,
+) -> str:
+    """Cache key builder that hashes only the query/path arguments.
+
+    The default fastapi-cache key builder reprs every handler argument,
+    which would mix per-process service instances into the key. This one
+    keeps only plain request-parameter values (symbol, timeframe, period,
+    start_date, end_date, ...) and drops everything else - injected
+    dependencies repr with a memory address, which would make keys unique
+    per worker regardless of what the argument is named.
+    """
+    kwargs = kwargs or {}
+    params = {
+        key: value
+        for key, value in kwargs.items()
+        if value is None or isinstance(value, (str, int, float, bool, datetime))
+    }
+    payload = f"{func.__module__}:{func.__name__}:{sorted(params.items())}"
+    digest = hashlib.md5(payload.encode()).hexdigest()
+    return f"{namespace}:{digest}"
@@ -0,0 +1,40 @@
+import hashlib
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """Attach ETags to GET JSON responses and honor If-None-Match.
+
+    Polling dashboards refetch the same payloads constantly; when a body
+    hasn't changed the client gets a bodyless 304 instead of the full JSON.
+    Streaming endpoints are untouched - only buffered GET responses with a
+    JSON content type are hashed.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or "etag" in response.headers
+            or not response.headers.get("content-type", "").startswith("application/json")
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type
+        )
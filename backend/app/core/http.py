@@ -0,0 +1,20 @@
+import httpx
+
+# Shared connection-pooled client for all downstream HTTP (Yahoo, Finnhub,
+# AlphaVantage). Keep-alive + HTTP/2 multiplexing avoids a fresh TCP/TLS
+# handshake per call and lets batch fan-outs share connections.
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10,
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        # Idle sockets survive between dashboard polls (default is 5s,
+        # short enough that most follow-up requests re-handshook)
+        keepalive_expiry=60,
+    )
+)
+
+async def close_http_client():
+    """Close the shared client's pool (called from lifespan shutdown)"""
+    await http_client.aclose()
@@ -0,0 +1,12 @@
+from slowapi import Limiter
+
+def _symbol_key(request) -> str:
+    """Rate-limit per symbol rather than per client.
+
+    The ceiling being protected is yfinance's per-process allowance, so a
+    burst of requests for one symbol should throttle that symbol without
+    starving lookups for others.
+    """
+    return request.path_params.get("symbol", "global")
+
+limiter = Limiter(key_func=_symbol_key)
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """Coalesce duplicate in-flight calls behind a shared task.
+
+    Concurrent callers with the same key await one underlying coroutine
+    instead of each issuing their own downstream request - e.g. a burst of
+    requests for the same symbol during a cache miss results in a single
+    yfinance call instead of N.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        # shield so one caller being cancelled doesn't kill the shared task
+        return await asyncio.shield(task)
+
+# Per-process instance shared by the API routes
+singleflight = SingleFlight()
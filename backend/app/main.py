@@ -1,35 +1,87 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from brotli_asgi import BrotliMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 from fastapi.staticfiles import StaticFiles
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 import uvicorn
 from contextlib import asynccontextmanager
 
 from app.api.routes import assets, prices, strategies, forecast, backtest, news, export
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.etag import ETagMiddleware
+from app.core.http import close_http_client
+from app.core.ratelimit import limiter
+from app.services.market_data import MarketDataService, MarketDataBatcher
+from app.services.strategy_service import StrategyService
+from app.services.forecast_service import ForecastService
+from app.services.backtest_service import BacktestService
+from app.services.news_service import NewsService
+from app.services.export_service import ExportService
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    # Redis-backed response cache for the hot, slowly-changing GET endpoints.
+    # Authenticated/user-specific routes must not be cached.
+    FastAPICache.init(
+        RedisBackend(aioredis.from_url(settings.REDIS_URL)),
+        prefix="playfi"
+    )
+    # Service singletons - constructed once so every request reuses
+    # warm sessions/caches instead of re-initializing per call
+    app.state.market_service = MarketDataService()
+    app.state.market_batcher = MarketDataBatcher(app.state.market_service)
+    app.state.strategy_service = StrategyService()
+    app.state.forecast_service = ForecastService()
+    app.state.backtest_service = BacktestService()
+    app.state.news_service = NewsService()
+    app.state.export_service = ExportService()
     yield
     # Shutdown
-    pass
+    await close_http_client()
 
 app = FastAPI(
     title="Trading Research Platform API",
     description="Multi-Asset Strategy Research & Forecasting API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the nested backtest/price/news payloads several
+    # times faster than stdlib json and handles datetime/numpy natively
+    default_response_class=ORJSONResponse
 )
 
+# Per-symbol rate limiting so bursts 429 fast instead of piling into a
+# rate-limited Yahoo session
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+# Compression: price series / equity curves are highly repetitive JSON
+# (8-15x smaller on the wire). Brotli is registered first since browsers
+# advertise br ahead of gzip; gzip remains the fallback.
+app.add_middleware(BrotliMiddleware, minimum_size=512)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Conditional requests: unchanged GET payloads return bodyless 304s
+app.add_middleware(ETagMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit whitelists let the middleware serve a fixed preflight
+    # response; max_age keeps browsers from re-preflighting for a day
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
 # Include API routes
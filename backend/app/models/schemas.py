@@ -1,8 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional, Dict, Any, Literal
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
+_UTC = timezone.utc
+
+def _now_utc() -> datetime:
+    """Timestamp default: aware UTC, no per-call local-tz lookup"""
+    return datetime.now(_UTC)
+
 # Enums
 class AssetType(str, Enum):
     STOCK = "stock"
@@ -62,6 +68,10 @@ class AssetSearch(BaseModel):
     limit: int = 20
 
 class PriceData(BaseModel):
+    # Hottest model in the API (hundreds per response); frozen + ignore
+    # lets pydantic-core skip extra-attribute bookkeeping
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     timestamp: datetime
     open: float
     high: float
@@ -112,9 +122,11 @@ class ForecastResult(BaseModel):
     reasoning: str
     technical_conditions: List[str]
     ml_features: Dict[str, float]
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_utc)
 
 class TradeResult(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     entry_date: datetime
     exit_date: datetime
     entry_price: float
@@ -140,7 +152,13 @@ class BacktestResult(BaseModel):
     profit_factor: float
     trades: List[TradeResult]
     equity_curve: List[Dict[str, Any]]
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_utc)
+
+# Prebuilt adapters for the large BacktestResult collections - resolving
+# validators once at import and calling validate_python on the whole list
+# is much cheaper than per-item model validation inside loops
+TRADE_LIST_ADAPTER = TypeAdapter(List[TradeResult])
+EQUITY_CURVE_ADAPTER = TypeAdapter(List[Dict[str, Any]])
 
 class NewsItem(BaseModel):
     id: str
@@ -175,7 +193,7 @@ class SentimentAnalysis(BaseModel):
     negative_mentions: int
     neutral_mentions: int
     confidence: float = Field(..., ge=0, le=1)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_utc)
 
 # Request/Response Models
 class ForecastRequest(BaseModel):
@@ -216,4 +234,4 @@ class MLPrediction(BaseModel):
     confidence: float = Field(..., ge=0, le=1)
     feature_importance: Dict[str, float]
     model_version: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_now_utc)
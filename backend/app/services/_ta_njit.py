@@ -0,0 +1,61 @@
+"""Scalar technical-analysis kernels, JIT-compiled when numba is available.
+
+The quote and forecast paths only ever read the *latest* value of each
+indicator, so these run as tight scalar loops over the raw close array
+instead of materializing full rolling/ewm series. With numba installed
+the loops compile to native code (cached on disk across processes);
+without it they still work as plain Python over NumPy arrays.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit as _njit
+except ImportError:  # numba is an optional accelerator; fall back to plain Python
+    def _njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def _decorator(func):
+            return func
+        return _decorator
+
+
+@_njit(cache=True)
+def sma_last(values: np.ndarray, n: int) -> float:
+    """Mean of the trailing ``n`` values."""
+    total = 0.0
+    for i in range(values.shape[0] - n, values.shape[0]):
+        total += values[i]
+    return total / n
+
+
+@_njit(cache=True)
+def rsi_last(closes: np.ndarray, n: int) -> float:
+    """Latest RSI with Wilder smoothing.
+
+    Seeds the averages with the simple mean of the first ``n`` deltas,
+    then applies the standard ``(avg * (n - 1) + x) / n`` recurrence -
+    the textbook Wilder definition.
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        delta = closes[i] - closes[i - 1]
+        if delta > 0.0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= n
+    avg_loss /= n
+
+    for i in range(n + 1, closes.shape[0]):
+        delta = closes[i] - closes[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
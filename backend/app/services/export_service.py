@@ -1,6 +1,10 @@
+import asyncio
 import io
 import csv
 import json
+import logging
+import threading
+import pandas as pd
 from typing import Dict, Any
 from datetime import datetime
 from reportlab.lib.pagesizes import letter
@@ -9,54 +13,118 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 
+logger = logging.getLogger(__name__)
+
+# One scratch BytesIO per rendering thread: renders run synchronously in
+# executor threads (asyncio.to_thread), so thread-local reuse keeps the
+# grown bytearray warm across exports instead of reallocating multi-MB
+# buffers per call. (A ContextVar would not survive to_thread's context
+# copy, so thread-local is the working equivalent here.)
+_scratch = threading.local()
+
+
+def _scratch_buffer() -> io.BytesIO:
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None:
+        buf = _scratch.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
 class ExportService:
     def __init__(self):
+        # Style objects are immutable in practice and identical across
+        # reports; building them once here avoids re-parsing the sample
+        # stylesheet and re-allocating the same ParagraphStyle/TableStyle
+        # on every export
         self.styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self.styles['Heading1'],
+            fontSize=18,
+            spaceAfter=30,
+        )
+        self.metrics_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 14),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
     
     async def export_to_pdf(self, data: Dict[str, Any], export_type: str) -> bytes:
-        """Export data to PDF format"""
+        """Export data to PDF format.
+
+        Rendering is pure CPU (reportlab), so it runs in a worker thread to
+        keep the event loop free for other requests.
+        """
+        return await asyncio.to_thread(self.render_pdf, data, export_type)
+
+    def render_pdf(self, data: Dict[str, Any], export_type: str) -> bytes:
+        """Render the PDF document synchronously (called off the event loop)"""
         try:
-            buffer = io.BytesIO()
+            buffer = _scratch_buffer()
             doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
                                   topMargin=72, bottomMargin=18)
-            
+
             story = []
-            
+
             if export_type == "forecast":
-                story = await self._build_forecast_pdf(data, story)
+                story = self._build_forecast_pdf(data, story)
             elif export_type == "backtest":
-                story = await self._build_backtest_pdf(data, story)
-            
+                story = self._build_backtest_pdf(data, story)
+
             doc.build(story)
-            
-            pdf_data = buffer.getvalue()
-            buffer.close()
-            
-            return pdf_data
-            
-        except Exception as e:
-            print(f"PDF export error: {e}")
+
+            # getvalue() already copies the bytes out; the buffer itself is
+            # kept open for reuse by the next render on this thread
+            return buffer.getvalue()
+
+        except Exception:
+            logger.exception("PDF export error")
             return b""
     
     async def export_to_csv(self, data: Dict[str, Any], export_type: str) -> bytes:
         """Export data to CSV format"""
         try:
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            if export_type == "forecast":
-                await self._build_forecast_csv(data, writer)
-            elif export_type == "backtest":
-                await self._build_backtest_csv(data, writer)
-            
-            csv_data = output.getvalue().encode('utf-8')
-            output.close()
-            
-            return csv_data
-            
-        except Exception as e:
-            print(f"CSV export error: {e}")
+            chunks = []
+            async for chunk in self.iter_csv_rows(data, export_type):
+                chunks.append(chunk)
+            return "".join(chunks).encode('utf-8')
+
+        except Exception:
+            logger.exception("CSV export error")
             return b""
+
+    async def iter_csv_rows(self, data: Dict[str, Any], export_type: str):
+        """Stream CSV output one encoded row at a time.
+
+        Keeps memory near-constant for large trade logs / equity curves:
+        rows are formatted through a single StringIO that is reset after
+        every yield instead of materializing the whole document.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if export_type == "forecast":
+            rows = self._iter_forecast_rows(data)
+        elif export_type == "backtest":
+            rows = self._iter_backtest_rows(data)
+        else:
+            return
+
+        for row in rows:
+            if isinstance(row, str):
+                # Pre-rendered block (e.g. the trade table via DataFrame.to_csv)
+                yield row
+                continue
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
     
     async def generate_summary(self, data: Dict[str, Any], export_type: str) -> str:
         """Generate a shareable text summary"""
@@ -68,21 +136,13 @@ class ExportService:
             
             return "Summary generation failed"
             
-        except Exception as e:
-            print(f"Summary generation error: {e}")
+        except Exception:
+            logger.exception("Summary generation error")
             return "Summary generation failed"
     
-    async def _build_forecast_pdf(self, data: Dict[str, Any], story: list) -> list:
+    def _build_forecast_pdf(self, data: Dict[str, Any], story: list) -> list:
         """Build PDF content for forecast report"""
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-        )
-        
-        story.append(Paragraph("Trading Forecast Report", title_style))
+        story.append(Paragraph("Trading Forecast Report", self.title_style))
         story.append(Spacer(1, 12))
         
         # Strategy and Asset info
@@ -102,17 +162,8 @@ class ExportService:
         ]
         
         metrics_table = Table(metrics_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
+        metrics_table.setStyle(self.metrics_table_style)
+
         story.append(metrics_table)
         story.append(Spacer(1, 20))
         
@@ -130,17 +181,9 @@ class ExportService:
         
         return story
     
-    async def _build_backtest_pdf(self, data: Dict[str, Any], story: list) -> list:
+    def _build_backtest_pdf(self, data: Dict[str, Any], story: list) -> list:
         """Build PDF content for backtest report"""
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-        )
-        
-        story.append(Paragraph("Backtest Results Report", title_style))
+        story.append(Paragraph("Backtest Results Report", self.title_style))
         story.append(Spacer(1, 12))
         
         # Basic info
@@ -161,78 +204,63 @@ class ExportService:
         ]
         
         performance_table = Table(performance_data, colWidths=[2*inch, 2*inch])
-        performance_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
+        performance_table.setStyle(self.metrics_table_style)
+
         story.append(performance_table)
         
         return story
     
-    async def _build_forecast_csv(self, data: Dict[str, Any], writer) -> None:
-        """Build CSV content for forecast data"""
-        writer.writerow(['Forecast Report'])
-        writer.writerow(['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-        writer.writerow([])
-        
+    def _iter_forecast_rows(self, data: Dict[str, Any]):
+        """Yield CSV rows for forecast data"""
+        yield ['Forecast Report']
+        yield ['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+        yield []
+
         # Basic info
-        writer.writerow(['Strategy', data.get('strategy', {}).get('name', 'N/A')])
-        writer.writerow(['Asset Symbol', data.get('asset', {}).get('symbol', 'N/A')])
-        writer.writerow(['Asset Name', data.get('asset', {}).get('name', 'N/A')])
-        writer.writerow([])
-        
+        yield ['Strategy', data.get('strategy', {}).get('name', 'N/A')]
+        yield ['Asset Symbol', data.get('asset', {}).get('symbol', 'N/A')]
+        yield ['Asset Name', data.get('asset', {}).get('name', 'N/A')]
+        yield []
+
         # Metrics
-        writer.writerow(['Metrics'])
-        writer.writerow(['Confidence (%)', data.get('confidence', 0)])
-        writer.writerow(['Expected Return ($)', data.get('expected_return', 0)])
-        writer.writerow(['Win Probability (%)', data.get('win_probability', 0)])
-        writer.writerow(['Risk/Reward Ratio', data.get('reward_risk_ratio', 0)])
-        writer.writerow(['Valid Signal', 'Yes' if data.get('is_valid', False) else 'No'])
-        writer.writerow([])
-        
+        yield ['Metrics']
+        yield ['Confidence (%)', data.get('confidence', 0)]
+        yield ['Expected Return ($)', data.get('expected_return', 0)]
+        yield ['Win Probability (%)', data.get('win_probability', 0)]
+        yield ['Risk/Reward Ratio', data.get('reward_risk_ratio', 0)]
+        yield ['Valid Signal', 'Yes' if data.get('is_valid', False) else 'No']
+        yield []
+
         # Entry points
         if data.get('entry_points'):
-            writer.writerow(['Entry Points'])
+            yield ['Entry Points']
             for i, price in enumerate(data['entry_points']):
-                writer.writerow([f'Entry {i+1}', price])
-    
-    async def _build_backtest_csv(self, data: Dict[str, Any], writer) -> None:
-        """Build CSV content for backtest data"""
-        writer.writerow(['Backtest Report'])
-        writer.writerow(['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-        writer.writerow([])
-        
+                yield [f'Entry {i+1}', price]
+
+    def _iter_backtest_rows(self, data: Dict[str, Any]):
+        """Yield CSV rows for backtest data"""
+        yield ['Backtest Report']
+        yield ['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+        yield []
+
         # Performance metrics
-        writer.writerow(['Performance Metrics'])
-        writer.writerow(['Total Return (%)', data.get('total_return', 0)])
-        writer.writerow(['Win Rate (%)', data.get('win_rate', 0)])
-        writer.writerow(['Total Trades', data.get('total_trades', 0)])
-        writer.writerow(['Sharpe Ratio', data.get('sharpe_ratio', 0)])
-        writer.writerow(['Max Drawdown (%)', data.get('max_drawdown', 0)])
-        writer.writerow(['Profit Factor', data.get('profit_factor', 0)])
-        writer.writerow([])
-        
-        # Trades
+        yield ['Performance Metrics']
+        yield ['Total Return (%)', data.get('total_return', 0)]
+        yield ['Win Rate (%)', data.get('win_rate', 0)]
+        yield ['Total Trades', data.get('total_trades', 0)]
+        yield ['Sharpe Ratio', data.get('sharpe_ratio', 0)]
+        yield ['Max Drawdown (%)', data.get('max_drawdown', 0)]
+        yield ['Profit Factor', data.get('profit_factor', 0)]
+        yield []
+
+        # Trades: render the whole table through pandas' C csv writer in one
+        # shot instead of a Python-level writerow call per trade
         if data.get('trades'):
-            writer.writerow(['Trade History'])
-            writer.writerow(['Entry Date', 'Exit Date', 'Entry Price', 'Exit Price', 'PnL', 'Type', 'Reason'])
-            for trade in data['trades']:
-                writer.writerow([
-                    trade.get('entry_date', ''),
-                    trade.get('exit_date', ''),
-                    trade.get('entry_price', 0),
-                    trade.get('exit_price', 0),
-                    trade.get('pnl', 0),
-                    trade.get('type', ''),
-                    trade.get('reason', '')
-                ])
+            yield ['Trade History']
+            yield ['Entry Date', 'Exit Date', 'Entry Price', 'Exit Price', 'PnL', 'Type', 'Reason']
+            columns = ['entry_date', 'exit_date', 'entry_price', 'exit_price', 'pnl', 'type', 'reason']
+            trades_df = pd.DataFrame(data['trades']).reindex(columns=columns)
+            yield trades_df.to_csv(index=False, header=False, lineterminator='\r\n')
     
     async def _build_forecast_summary(self, data: Dict[str, Any]) -> str:
         """Build text summary for forecast"""
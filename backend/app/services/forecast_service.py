@@ -1,16 +1,48 @@
+import asyncio
+import os
+
 import numpy as np
 import pandas as pd
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import random
-from app.models.schemas import ForecastResult, Strategy, Asset, TimeFrame
+from app.core.config import settings
+from app.models.schemas import ForecastResult, Strategy, StrategyCategory, Asset, TimeFrame
 from app.services.market_data import MarketDataService
 from app.services.strategy_service import StrategyService
 
+# Entry/exit ladders as constant multiplier vectors: one vectorized
+# multiply per forecast instead of rebuilding the literal lists per call
+_LONG_ENTRY_MULT = np.array([0.99, 0.975, 0.96])      # 1% / 2.5% / 4% below
+_SHORT_ENTRY_MULT = np.array([1.01, 1.025, 1.04])     # 1% / 2.5% / 4% above
+_NEUTRAL_ENTRY_MULT = np.array([0.995, 1.0, 1.005])   # current price area
+_LONG_EXIT_MULT = np.array([1.05, 1.10, 1.15])        # 5% / 10% / 15% profit
+_SHORT_EXIT_MULT = np.array([0.95, 0.90, 0.85])       # 5% / 10% / 15% profit
+
 class ForecastService:
     def __init__(self):
         self.market_service = MarketDataService()
         self.strategy_service = StrategyService()
+        # One PCG64 generator for all simulated jitter - avoids taking the
+        # global random-module lock on every score
+        self._rng = np.random.default_rng()
+        # Category -> handler/ladder dispatch instead of re-running the
+        # same chain of string compares in every scorer. Spreads and iron
+        # condors share the neutral rule set; straddle/strangle have no
+        # rule set yet and fall through to "no conditions met".
+        self._rule_handlers = {
+            StrategyCategory.LONG: self._long_rule_conditions,
+            StrategyCategory.SHORT: self._short_rule_conditions,
+            StrategyCategory.SPREAD: self._neutral_rule_conditions,
+            StrategyCategory.IRON_CONDOR: self._neutral_rule_conditions,
+        }
+        self._entry_mults = {
+            StrategyCategory.LONG: _LONG_ENTRY_MULT,
+            StrategyCategory.SHORT: _SHORT_ENTRY_MULT,
+        }
+        self._exit_mults = {
+            StrategyCategory.LONG: _LONG_EXIT_MULT,
+            StrategyCategory.SHORT: _SHORT_EXIT_MULT,
+        }
     
     async def generate_forecast(
         self,
@@ -19,46 +51,78 @@ class ForecastService:
         timeframe: TimeFrame
     ) -> Optional[ForecastResult]:
         """Generate forecast using hybrid rule-based + ML approach"""
+        # One fetch for the bars; the indicator call reuses them and does
+        # no network I/O of its own
+        price_data = await self.market_service.get_historical_data(symbol, timeframe, "3mo")
+        indicators = await self.market_service.get_technical_indicators(
+            symbol, timeframe, price_data=price_data
+        )
+
+        return await self.score_with_data(
+            symbol=symbol,
+            strategy_id=strategy_id,
+            timeframe=timeframe,
+            price_data=price_data,
+            indicators=indicators
+        )
+
+    async def score_with_data(
+        self,
+        symbol: str,
+        strategy_id: str,
+        timeframe: TimeFrame,
+        price_data: List,
+        indicators
+    ) -> Optional[ForecastResult]:
+        """Score a strategy against already-fetched price data and indicators.
+
+        Used by batch forecasting so the symbol's history is downloaded once
+        and shared across strategies instead of re-fetched per strategy.
+        """
         try:
-            # Get strategy and asset info
-            strategy = await self.strategy_service.get_strategy(strategy_id)
-            asset = await self.market_service.get_asset_info(symbol)
-            
+            # Strategy, asset and quote lookups are independent of each
+            # other - collapse three sequential round-trips into one
+            strategy, asset, market_data = await asyncio.gather(
+                self.strategy_service.get_strategy(strategy_id),
+                self.market_service.get_asset_info(symbol),
+                self.market_service.get_market_data(symbol),
+            )
+
             if not strategy or not asset:
                 return None
-            
-            # Get market data and indicators
-            price_data = await self.market_service.get_historical_data(symbol, timeframe, "3mo")
-            indicators = await self.market_service.get_technical_indicators(symbol, timeframe)
-            market_data = await self.market_service.get_market_data(symbol)
-            
+
             if not price_data or not indicators or not market_data:
                 return None
-            
+
+            # One extraction pass shared by the rule and ML helpers below
+            closes, volumes = self._as_arrays(price_data)
+
             # Step 1: Rule-based pattern detection
-            rule_result = await self._check_technical_rules(strategy, price_data, indicators, market_data)
+            rule_result = self._check_technical_rules(
+                strategy, closes, volumes, indicators, market_data
+            )
             
             # Step 2: ML confidence scoring (simulated for demo)
-            ml_result = await self._ml_confidence_score(strategy, price_data, indicators, market_data)
+            ml_result = self._ml_confidence_score(strategy, closes, volumes, indicators, market_data)
             
             # Combine results
             is_valid = rule_result['is_valid']
             confidence = ml_result['confidence'] if is_valid else max(0, ml_result['confidence'] - 30)
             
             # Generate entry/exit points
-            entry_points = await self._calculate_entry_points(market_data.current_price, strategy, indicators)
-            exit_points = await self._calculate_exit_points(entry_points, strategy) if entry_points else None
+            entry_points = self._calculate_entry_points(market_data.current_price, strategy, indicators)
+            exit_points = self._calculate_exit_points(entry_points, strategy) if entry_points else None
             
             # Calculate expected return and risk metrics
-            expected_return = await self._calculate_expected_return(
+            expected_return = self._calculate_expected_return(
                 strategy, market_data.current_price, entry_points, ml_result
             )
             
             reward_risk_ratio = abs(expected_return / (strategy.max_loss or 1000))
-            win_probability = min(95, max(5, confidence * 0.8 + random.uniform(-5, 5)))
+            win_probability = min(95, max(5, confidence * 0.8 + self._rng.uniform(-5, 5)))
             
             # Generate reasoning
-            reasoning = await self._generate_reasoning(
+            reasoning = self._generate_reasoning(
                 strategy, rule_result, ml_result, market_data, indicators
             )
             
@@ -88,99 +152,142 @@ class ForecastService:
         timeframe: TimeFrame
     ) -> List[ForecastResult]:
         """Generate forecasts for multiple strategies"""
-        forecasts = []
-        
-        for strategy_id in strategy_ids:
-            forecast = await self.generate_forecast(symbol, strategy_id, timeframe)
-            if forecast:
-                forecasts.append(forecast)
-        
+        # Fetch the symbol's bars once, derive indicators from them without
+        # a second round-trip, then score every strategy concurrently; the
+        # semaphore bounds the fan-out so a large batch doesn't hammer
+        # yfinance or the event loop
+        price_data = await self.market_service.get_historical_data(symbol, timeframe, "3mo")
+        indicators = await self.market_service.get_technical_indicators(
+            symbol, timeframe, price_data=price_data
+        )
+
+        sem = asyncio.Semaphore(settings.FORECAST_CONCURRENCY or os.cpu_count())
+
+        async def _score_one(strategy_id: str) -> Optional[ForecastResult]:
+            async with sem:
+                return await self.score_with_data(
+                    symbol=symbol,
+                    strategy_id=strategy_id,
+                    timeframe=timeframe,
+                    price_data=price_data,
+                    indicators=indicators
+                )
+
+        results = await asyncio.gather(
+            *(_score_one(strategy_id) for strategy_id in strategy_ids),
+            return_exceptions=True
+        )
+
+        # Keep the swallow-errors behavior: failed scorings just drop out
+        forecasts = [f for f in results if isinstance(f, ForecastResult)]
+
         # Sort by confidence score
         forecasts.sort(key=lambda x: x.confidence, reverse=True)
-        
+
         return forecasts
     
-    async def get_forecast_history(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_forecast_history(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get historical forecasts for an asset (placeholder)"""
         # In a real implementation, this would fetch from database
         return []
     
-    async def _check_technical_rules(
+    @staticmethod
+    def _as_arrays(price_data: List) -> tuple:
+        """Extract (closes, volumes) ndarrays once per bar list.
+
+        The rule and ML scorers each sliced and re-summed the Pydantic
+        objects; sharing one extraction keeps all their math on C-level
+        array reductions. float32 halves the footprint and doubles SIMD
+        width; the scorers only produce coarse ratios and thresholds, so
+        the precision is ample.
+        """
+        n = len(price_data)
+        closes = np.fromiter((p.close for p in price_data), dtype=np.float32, count=n)
+        volumes = np.fromiter((p.volume for p in price_data), dtype=np.float32, count=n)
+        return closes, volumes
+
+    def _check_technical_rules(
         self,
         strategy: Strategy,
-        price_data: List,
+        closes: np.ndarray,
+        volumes: np.ndarray,
         indicators,
         market_data
     ) -> Dict[str, Any]:
         """Check if technical conditions are met for the strategy"""
-        conditions_met = []
-        is_valid = False
-        
-        current_price = market_data.current_price
-        
-        # Example rule checks based on strategy type
-        if strategy.category.value == "long":
-            # Long strategies
-            if indicators.rsi and indicators.rsi > 50:
-                conditions_met.append(f"RSI ({indicators.rsi:.1f}) above 50 - bullish momentum")
-            
-            if indicators.sma20 and current_price > indicators.sma20:
-                conditions_met.append(f"Price above SMA20 ({indicators.sma20:.2f}) - uptrend")
-            
-            if len(price_data) >= 5:
-                recent_volume = sum([p.volume for p in price_data[-5:]])
-                avg_volume = sum([p.volume for p in price_data]) / len(price_data)
-                if recent_volume > avg_volume * 5 * 1.2:
-                    conditions_met.append("Above average volume - strong interest")
-            
-            is_valid = len(conditions_met) >= 2
-            
-        elif strategy.category.value == "short":
-            # Short strategies
-            if indicators.rsi and indicators.rsi > 70:
-                conditions_met.append(f"RSI ({indicators.rsi:.1f}) overbought - reversal signal")
-            
-            if indicators.sma20 and current_price < indicators.sma20:
-                conditions_met.append(f"Price below SMA20 ({indicators.sma20:.2f}) - downtrend")
-            
-            is_valid = len(conditions_met) >= 1
-            
-        elif "spread" in strategy.category.value or "condor" in strategy.category.value:
-            # Neutral strategies
-            if indicators.rsi and 40 <= indicators.rsi <= 60:
-                conditions_met.append(f"RSI ({indicators.rsi:.1f}) neutral - sideways movement expected")
-            
-            # Check for low volatility (simplified)
-            if len(price_data) >= 20:
-                recent_prices = [p.close for p in price_data[-20:]]
-                volatility = np.std(recent_prices) / np.mean(recent_prices)
-                if volatility < 0.02:  # Low volatility
-                    conditions_met.append("Low volatility environment - good for neutral strategies")
-            
-            is_valid = len(conditions_met) >= 1
-        
+        handler = self._rule_handlers.get(strategy.category)
+        if handler is not None:
+            conditions_met, is_valid = handler(
+                closes, volumes, indicators, market_data.current_price
+            )
+        else:
+            conditions_met, is_valid = [], False
+
         return {
             'is_valid': is_valid,
             'conditions_met': conditions_met,
             'score': len(conditions_met) * 25  # Simple scoring
         }
+
+    def _long_rule_conditions(self, closes, volumes, indicators, current_price):
+        conditions_met = []
+        if indicators.rsi and indicators.rsi > 50:
+            conditions_met.append(f"RSI ({indicators.rsi:.1f}) above 50 - bullish momentum")
+
+        if indicators.sma20 and current_price > indicators.sma20:
+            conditions_met.append(f"Price above SMA20 ({indicators.sma20:.2f}) - uptrend")
+
+        if volumes.size >= 5:
+            recent_volume = float(volumes[-5:].sum())
+            avg_volume = float(volumes.mean())
+            if recent_volume > avg_volume * 5 * 1.2:
+                conditions_met.append("Above average volume - strong interest")
+
+        return conditions_met, len(conditions_met) >= 2
+
+    def _short_rule_conditions(self, closes, volumes, indicators, current_price):
+        conditions_met = []
+        if indicators.rsi and indicators.rsi > 70:
+            conditions_met.append(f"RSI ({indicators.rsi:.1f}) overbought - reversal signal")
+
+        if indicators.sma20 and current_price < indicators.sma20:
+            conditions_met.append(f"Price below SMA20 ({indicators.sma20:.2f}) - downtrend")
+
+        return conditions_met, len(conditions_met) >= 1
+
+    def _neutral_rule_conditions(self, closes, volumes, indicators, current_price):
+        conditions_met = []
+        if indicators.rsi and 40 <= indicators.rsi <= 60:
+            conditions_met.append(f"RSI ({indicators.rsi:.1f}) neutral - sideways movement expected")
+
+        # Check for low volatility (simplified)
+        if closes.size >= 20:
+            recent = closes[-20:]
+            volatility = float(recent.std() / recent.mean())
+            if volatility < 0.02:  # Low volatility
+                conditions_met.append("Low volatility environment - good for neutral strategies")
+
+        return conditions_met, len(conditions_met) >= 1
     
-    async def _ml_confidence_score(
+    def _ml_confidence_score(
         self,
         strategy: Strategy,
-        price_data: List,
+        closes: np.ndarray,
+        volumes: np.ndarray,
         indicators,
         market_data
     ) -> Dict[str, Any]:
         """Simulate ML model confidence scoring"""
         # In a real implementation, this would use trained ML models
-        
-        # Extract features
+
+        # Features straight off the shared arrays - no per-feature list
+        # comprehensions over the Pydantic bars
+        recent_closes = closes[-20:]
         features = {
-            'price_momentum': (market_data.current_price - price_data[-20].close) / price_data[-20].close if len(price_data) >= 20 else 0,
+            'price_momentum': float((market_data.current_price - closes[-20]) / closes[-20]) if closes.size >= 20 else 0,
             'rsi': indicators.rsi or 50,
-            'volume_ratio': price_data[-1].volume / (sum([p.volume for p in price_data[-10:]]) / 10) if len(price_data) >= 10 else 1,
-            'volatility': np.std([p.close for p in price_data[-20:]]) / np.mean([p.close for p in price_data[-20:]]) if len(price_data) >= 20 else 0.02,
+            'volume_ratio': float(volumes[-1] / volumes[-10:].mean()) if volumes.size >= 10 else 1,
+            'volatility': float(recent_closes.std() / recent_closes.mean()) if closes.size >= 20 else 0.02,
             'trend_strength': abs(indicators.sma20 - indicators.sma50) / indicators.sma50 if indicators.sma20 and indicators.sma50 else 0
         }
         
@@ -203,7 +310,7 @@ class ForecastService:
                 base_confidence += 15
         
         # Add some randomness to simulate model uncertainty
-        confidence = max(5, min(95, base_confidence + random.uniform(-10, 10)))
+        confidence = max(5, min(95, base_confidence + self._rng.uniform(-10, 10)))
         
         return {
             'confidence': confidence,
@@ -211,46 +318,25 @@ class ForecastService:
             'model_version': 'v1.0-demo'
         }
     
-    async def _calculate_entry_points(
+    def _calculate_entry_points(
         self,
         current_price: float,
         strategy: Strategy,
         indicators
     ) -> List[float]:
         """Calculate optimal entry points"""
-        entry_points = []
-        
-        if strategy.category.value == "long":
-            # For long positions, suggest entries below current price
-            entry_points = [
-                current_price * 0.99,  # 1% below
-                current_price * 0.975, # 2.5% below
-                current_price * 0.96   # 4% below
-            ]
-            
-            # Add technical levels
-            if indicators.sma20:
-                entry_points.append(indicators.sma20)
-            
-        elif strategy.category.value == "short":
-            # For short positions, suggest entries above current price
-            entry_points = [
-                current_price * 1.01,  # 1% above
-                current_price * 1.025, # 2.5% above
-                current_price * 1.04   # 4% above
-            ]
-        
-        else:
-            # For neutral strategies, suggest current price area
-            entry_points = [
-                current_price * 0.995,
-                current_price,
-                current_price * 1.005
-            ]
-        
+        # Longs/shorts ladder away from the current price; everything else
+        # clusters around it
+        mult = self._entry_mults.get(strategy.category, _NEUTRAL_ENTRY_MULT)
+        entry_points = (current_price * mult).tolist()
+
+        # Add technical levels for longs
+        if strategy.category is StrategyCategory.LONG and indicators.sma20:
+            entry_points.append(indicators.sma20)
+
         return sorted(entry_points)[:3]  # Return top 3
     
-    async def _calculate_exit_points(
+    def _calculate_exit_points(
         self,
         entry_points: List[float],
         strategy: Strategy
@@ -259,27 +345,14 @@ class ForecastService:
         if not entry_points:
             return []
         
+        mult = self._exit_mults.get(strategy.category)
+        if mult is None:
+            return []
+
         avg_entry = sum(entry_points) / len(entry_points)
-        exit_points = []
-        
-        if strategy.category.value == "long":
-            # Profit targets above entry
-            exit_points = [
-                avg_entry * 1.05,   # 5% profit
-                avg_entry * 1.10,   # 10% profit
-                avg_entry * 1.15    # 15% profit
-            ]
-        elif strategy.category.value == "short":
-            # Profit targets below entry
-            exit_points = [
-                avg_entry * 0.95,   # 5% profit
-                avg_entry * 0.90,   # 10% profit
-                avg_entry * 0.85    # 15% profit
-            ]
-        
-        return exit_points
+        return (avg_entry * mult).tolist()
     
-    async def _calculate_expected_return(
+    def _calculate_expected_return(
         self,
         strategy: Strategy,
         current_price: float,
@@ -304,7 +377,7 @@ class ForecastService:
         
         return round(dollar_return, 2)
     
-    async def _generate_reasoning(
+    def _generate_reasoning(
         self,
         strategy: Strategy,
         rule_result: Dict[str, Any],
@@ -1,89 +1,136 @@
-import yfinance as yf
 import asyncio
+import time
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
 from app.models.schemas import Asset, PriceData, MarketData, TechnicalIndicators, TimeFrame
 from app.core.config import settings
-import aiohttp
+from app.core import http
+from app.core.cache import get_redis
+from app.services._ta_njit import rsi_last, sma_last
 import json
+import pickle
+
+# Indicator cache lifetime per timeframe - a 1h bar is stale after a
+# minute, a daily bar after an hour
+INDICATOR_CACHE_TTL = {
+    "1h": 60,
+    "4h": 300,
+    "1d": 3600,
+}
+
+# In-process TTL per fetch type: quotes go stale in a minute, historical
+# bars and static asset metadata last an hour
+QUOTE_CACHE_TTL = 60
+HISTORY_CACHE_TTL = 3600
+
+# Map app timeframes to yfinance intervals
+_YF_INTERVAL_MAP = {
+    "1h": "1h",
+    "4h": "4h",
+    "1d": "1d",
+    "1w": "1wk",
+    "1M": "1mo",
+    "3M": "3mo",
+    "6M": "3mo",  # yfinance doesn't have 6M
+    "1Y": "3mo",
+    "3Y": "3mo",
+    "5Y": "3mo",
+    "YTD": "1d"
+}
+
+
+def _build_search_index() -> Dict[str, List[Asset]]:
+    """Index the demo asset catalog by every substring of its keywords.
+
+    The catalog is tiny and static, so pre-expanding substrings at import
+    turns each search into a single dict lookup instead of a scan that
+    rebuilt Asset objects per request.
+    """
+    catalog = [
+        (('apple', 'aapl'), Asset(symbol='AAPL', name='Apple Inc.', type='stock', exchange='NASDAQ')),
+        (('tesla', 'tsla'), Asset(symbol='TSLA', name='Tesla Inc.', type='stock', exchange='NASDAQ')),
+        (('microsoft', 'msft'), Asset(symbol='MSFT', name='Microsoft Corp.', type='stock', exchange='NASDAQ')),
+        (('amazon', 'amzn'), Asset(symbol='AMZN', name='Amazon.com Inc.', type='stock', exchange='NASDAQ')),
+        (('google', 'googl'), Asset(symbol='GOOGL', name='Alphabet Inc.', type='stock', exchange='NASDAQ')),
+        (('bitcoin', 'btc-usd'), Asset(symbol='BTC-USD', name='Bitcoin', type='crypto', exchange='Crypto')),
+        (('ethereum', 'eth-usd'), Asset(symbol='ETH-USD', name='Ethereum', type='crypto', exchange='Crypto')),
+        (('gold', 'gc=f'), Asset(symbol='GC=F', name='Gold Futures', type='future', exchange='COMEX')),
+        (('oil', 'cl=f'), Asset(symbol='CL=F', name='Crude Oil Futures', type='future', exchange='NYMEX')),
+        (('spy', 'spx', 's&p'), Asset(symbol='SPY', name='SPDR S&P 500 ETF Trust', type='stock', exchange='NYSE')),
+        (('qqq', 'nasdaq'), Asset(symbol='QQQ', name='Invesco QQQ Trust', type='stock', exchange='NASDAQ')),
+    ]
+
+    index: Dict[str, List[Asset]] = {}
+    for keywords, asset in catalog:
+        for keyword in keywords:
+            for i in range(len(keyword)):
+                for j in range(i + 1, len(keyword) + 1):
+                    bucket = index.setdefault(keyword[i:j], [])
+                    # Keywords of the same asset share substrings
+                    if not bucket or bucket[-1] is not asset:
+                        bucket.append(asset)
+    return index
+
+
+_SEARCH_INDEX = _build_search_index()
+
 
 class MarketDataService:
-    def __init__(self):
-        self.session = None
-    
-    async def get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
-    async def close_session(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
-    
+    def __init__(self, http_client=None):
+        # Shared keep-alive pool instead of a per-service aiohttp session
+        self.http_client = http_client or http.http_client
+        # (key) -> (expires_at, value); batch forecasting and dashboards
+        # hit the same symbol many times within seconds, and serving from
+        # memory turns those repeats into dict lookups
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+    async def _cached(
+        self,
+        key: Tuple,
+        ttl: int,
+        coro_factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """TTL cache with single-flight: concurrent callers of the same key
+        share one in-flight fetch instead of racing duplicate requests."""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+
+        value = await asyncio.shield(task)
+        # Empty/None results are transient failures - don't pin them for a
+        # full TTL
+        if value:
+            self._cache[key] = (now + ttl, value)
+        return value
+
     async def search_assets(self, query: str, limit: int = 20) -> List[Asset]:
-        """Search for assets using various APIs and yfinance"""
-        try:
-            # For demo purposes, return mock data with real symbols
-            mock_results = []
-            
-            # Add some real stock symbols that match the query
-            stock_symbols = {
-                'apple': [{'symbol': 'AAPL', 'name': 'Apple Inc.', 'exchange': 'NASDAQ'}],
-                'tesla': [{'symbol': 'TSLA', 'name': 'Tesla Inc.', 'exchange': 'NASDAQ'}],
-                'microsoft': [{'symbol': 'MSFT', 'name': 'Microsoft Corp.', 'exchange': 'NASDAQ'}],
-                'amazon': [{'symbol': 'AMZN', 'name': 'Amazon.com Inc.', 'exchange': 'NASDAQ'}],
-                'google': [{'symbol': 'GOOGL', 'name': 'Alphabet Inc.', 'exchange': 'NASDAQ'}],
-                'bitcoin': [{'symbol': 'BTC-USD', 'name': 'Bitcoin', 'exchange': 'Crypto'}],
-                'ethereum': [{'symbol': 'ETH-USD', 'name': 'Ethereum', 'exchange': 'Crypto'}],
-                'gold': [{'symbol': 'GC=F', 'name': 'Gold Futures', 'exchange': 'COMEX'}],
-                'oil': [{'symbol': 'CL=F', 'name': 'Crude Oil Futures', 'exchange': 'NYMEX'}],
-            }
-            
-            query_lower = query.lower()
-            
-            # Search in predefined symbols
-            for key, symbols in stock_symbols.items():
-                if query_lower in key or any(query_lower in symbol['symbol'].lower() for symbol in symbols):
-                    for symbol_data in symbols:
-                        asset_type = 'crypto' if 'USD' in symbol_data['symbol'] else \
-                                   'future' if '=F' in symbol_data['symbol'] else 'stock'
-                        
-                        mock_results.append(Asset(
-                            symbol=symbol_data['symbol'],
-                            name=symbol_data['name'],
-                            type=asset_type,
-                            exchange=symbol_data['exchange']
-                        ))
-            
-            # Add some additional matches based on query
-            if query_lower in ['spy', 'spx', 's&p']:
-                mock_results.append(Asset(
-                    symbol='SPY',
-                    name='SPDR S&P 500 ETF Trust',
-                    type='stock',
-                    exchange='NYSE'
-                ))
-            
-            if query_lower in ['qqq', 'nasdaq']:
-                mock_results.append(Asset(
-                    symbol='QQQ',
-                    name='Invesco QQQ Trust',
-                    type='stock',
-                    exchange='NASDAQ'
-                ))
-            
-            return mock_results[:limit]
-            
-        except Exception as e:
-            print(f"Asset search error: {e}")
-            return []
+        """Search the demo asset catalog (precomputed substring index)"""
+        return _SEARCH_INDEX.get(query.lower().strip(), [])[:limit]
     
     async def get_asset_info(self, symbol: str) -> Optional[Asset]:
-        """Get detailed asset information"""
+        """Get detailed asset information (memory-cached; metadata is ~static)"""
+        return await self._cached(
+            ("asset_info", symbol),
+            HISTORY_CACHE_TTL,
+            lambda: self._fetch_asset_info(symbol)
+        )
+
+    async def _fetch_asset_info(self, symbol: str) -> Optional[Asset]:
         try:
+            # Deferred import: yfinance pulls pandas/lxml/requests (~400ms),
+            # which would otherwise land on process startup
+            import yfinance as yf
+
             # Use yfinance to get real asset info
             ticker = yf.Ticker(symbol)
             info = ticker.info
@@ -122,60 +169,189 @@ class MarketDataService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[PriceData]:
-        """Get historical price data"""
+        """Get historical price data (memory-cached per requested window)"""
+        key = (
+            "hist", symbol, getattr(timeframe, "value", timeframe), period,
+            start_date.isoformat() if start_date else None,
+            end_date.isoformat() if end_date else None,
+        )
+        return await self._cached(
+            key,
+            HISTORY_CACHE_TTL,
+            lambda: self._fetch_historical_data(symbol, timeframe, period, start_date, end_date)
+        )
+
+    async def _fetch_historical_data(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        period: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[PriceData]:
+        interval = _YF_INTERVAL_MAP.get(timeframe, "1d")
+
+        # Period-shaped requests go straight to Yahoo's chart endpoint over
+        # the shared async client: yfinance blocks the event loop for every
+        # history() call, which silently serializes concurrent fan-outs
+        if not (start_date and end_date):
+            try:
+                bars = await self._fetch_chart_async(symbol, interval, period or "1y")
+                if bars:
+                    return bars
+            except Exception as e:
+                print(f"Chart endpoint error for {symbol}, falling back to yfinance: {e}")
+
         try:
+            import yfinance as yf
+
             ticker = yf.Ticker(symbol)
-            
-            # Map timeframe to yfinance interval
-            interval_map = {
-                "1h": "1h",
-                "4h": "4h", 
-                "1d": "1d",
-                "1w": "1wk",
-                "1M": "1mo",
-                "3M": "3mo",
-                "6M": "3mo",  # yfinance doesn't have 6M
-                "1Y": "3mo",
-                "3Y": "3mo",
-                "5Y": "3mo",
-                "YTD": "1d"
-            }
-            
-            interval = interval_map.get(timeframe, "1d")
-            
+
             if start_date and end_date:
                 hist = ticker.history(start=start_date, end=end_date, interval=interval)
             else:
                 period = period or "1y"
                 hist = ticker.history(period=period, interval=interval)
-            
-            if hist.empty:
-                return []
-            
-            price_data = []
-            for index, row in hist.iterrows():
-                # Calculate VWAP approximation
-                vwap = ((row['High'] + row['Low'] + row['Close']) / 3 * row['Volume']).sum() / row['Volume'] if row['Volume'] > 0 else None
-                
-                price_data.append(PriceData(
-                    timestamp=index.to_pydatetime(),
-                    open=float(row['Open']),
-                    high=float(row['High']),
-                    low=float(row['Low']),
-                    close=float(row['Close']),
-                    volume=int(row['Volume']),
-                    vwap=vwap
-                ))
-            
-            return price_data
-            
+
+            return self._frame_to_price_data(hist)
+
         except Exception as e:
             print(f"Historical data error for {symbol}: {e}")
             return []
-    
+
+    async def _fetch_chart_async(self, symbol: str, interval: str, range_: str) -> List[PriceData]:
+        """Fetch bars from query1.finance.yahoo.com/v8/finance/chart.
+
+        Parses the JSON payload straight into NumPy arrays and PriceData -
+        no pandas frame, no blocking HTTP. Raises on transport/shape errors
+        so the caller can fall back to yfinance.
+        """
+        resp = await self.http_client.get(
+            f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}",
+            params={"interval": interval, "range": range_},
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        resp.raise_for_status()
+        result = resp.json()["chart"]["result"][0]
+
+        stamps = result.get("timestamp")
+        if not stamps:
+            return []
+        quote = result["indicators"]["quote"][0]
+
+        def _col(values):
+            # Missing bars come back as JSON nulls
+            return np.array([v if v is not None else np.nan for v in values], dtype=np.float64)
+
+        opens = _col(quote["open"])
+        highs = _col(quote["high"])
+        lows = _col(quote["low"])
+        closes = _col(quote["close"])
+        volumes = _col(quote["volume"])
+        volumes[np.isnan(volumes)] = 0.0
+
+        typical_price = (highs + lows + closes) / 3.0
+        cum_volume = volumes.cumsum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vwap_arr = (typical_price * volumes).cumsum() / cum_volume
+
+        return [
+            PriceData.model_construct(
+                timestamp=datetime.fromtimestamp(stamps[i], tz=timezone.utc),
+                open=float(opens[i]),
+                high=float(highs[i]),
+                low=float(lows[i]),
+                close=float(closes[i]),
+                volume=int(volumes[i]),
+                vwap=float(vwap_arr[i]) if volumes[i] > 0 else None
+            )
+            for i in range(len(stamps))
+            if not np.isnan(closes[i])
+        ]
+
+    async def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        timeframe: TimeFrame,
+        period: Optional[str] = None
+    ) -> Dict[str, List[PriceData]]:
+        """Fetch history for many symbols in one yfinance download.
+
+        yf.download issues the per-ticker requests concurrently
+        (threads=True) and returns a single frame, so scanning N symbols
+        costs one call instead of N sequential Ticker.history round-trips.
+        """
+        if not symbols:
+            return {}
+        try:
+            import yfinance as yf
+
+            # yf.download blocks while its worker threads fetch; keep the
+            # wait itself off the event loop
+            data = await asyncio.to_thread(
+                yf.download,
+                tickers=list(symbols),
+                period=period or "1y",
+                interval=_YF_INTERVAL_MAP.get(timeframe, "1d"),
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+
+            results: Dict[str, List[PriceData]] = {}
+            for symbol in symbols:
+                # With a single ticker yfinance returns flat columns; with
+                # several, a column group per ticker
+                frame = data if len(symbols) == 1 else data.get(symbol)
+                if frame is None or frame.empty:
+                    results[symbol] = []
+                else:
+                    results[symbol] = self._frame_to_price_data(frame.dropna(subset=['Close']))
+            return results
+
+        except Exception as e:
+            print(f"Batch historical data error for {symbols}: {e}")
+            return {symbol: [] for symbol in symbols}
+
+    @staticmethod
+    def _frame_to_price_data(hist: pd.DataFrame) -> List[PriceData]:
+        if hist.empty:
+            return []
+
+        # VWAP in one vectorized pass: cumulative price*volume over
+        # cumulative volume. The old per-row expression called .sum()
+        # on a scalar and reduced to the bar's typical price, which is
+        # not a VWAP at all.
+        typical_price = (hist['High'] + hist['Low'] + hist['Close']) / 3.0
+        cum_volume = hist['Volume'].cumsum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vwap_arr = ((typical_price * hist['Volume']).cumsum() / cum_volume).to_numpy()
+
+        # Bulk extraction instead of iterrows: one to_numpy copy and a
+        # tight comprehension over plain scalars, no pandas row objects
+        # or per-cell __getitem__ in the loop. model_construct skips
+        # per-field validation - values are already coerced below.
+        arr = hist[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy()
+        timestamps = hist.index.to_pydatetime()
+
+        return [
+            PriceData.model_construct(
+                timestamp=timestamps[i],
+                open=float(arr[i, 0]),
+                high=float(arr[i, 1]),
+                low=float(arr[i, 2]),
+                close=float(arr[i, 3]),
+                volume=int(arr[i, 4]),
+                vwap=float(vwap_arr[i]) if arr[i, 4] > 0 else None
+            )
+            for i in range(len(hist))
+        ]
+
     async def get_realtime_data(self, symbol: str) -> Optional[PriceData]:
         """Get real-time price data"""
         try:
+            import yfinance as yf
+
             ticker = yf.Ticker(symbol)
             hist = ticker.history(period="1d", interval="1m")
             
@@ -184,7 +360,7 @@ class MarketDataService:
             
             latest = hist.iloc[-1]
             
-            return PriceData(
+            return PriceData.model_construct(
                 timestamp=hist.index[-1].to_pydatetime(),
                 open=float(latest['Open']),
                 high=float(latest['High']),
@@ -198,39 +374,81 @@ class MarketDataService:
             print(f"Real-time data error for {symbol}: {e}")
             return None
     
-    async def get_market_data(self, symbol: str) -> Optional[MarketData]:
-        """Get current market data for an asset"""
+    async def get_market_data(self, symbol: str, ticker=None) -> Optional[MarketData]:
+        """Get current market data for an asset.
+
+        An already-constructed yfinance Ticker can be passed in so batched
+        multi-ticker lookups reuse one shared session. Quotes are memory-
+        cached for a minute.
+        """
+        return await self._cached(
+            ("market", symbol),
+            QUOTE_CACHE_TTL,
+            lambda: self._fetch_market_data(symbol, ticker)
+        )
+
+    async def _ticker_fundamentals(self, symbol: str, ticker) -> Dict[str, Any]:
+        """Hour-cached ticker.info: it scrapes the full quoteSummary payload
+        (an order of magnitude slower than the quote endpoint), and the
+        fundamentals it carries - PE, beta, dividend yield - move on the
+        same timescale as asset metadata."""
+        async def _fetch():
+            try:
+                # ticker.info blocks on HTTP; keep it off the event loop
+                return await asyncio.to_thread(lambda: ticker.info or {})
+            except Exception:
+                return {}
+
+        return await self._cached(("fundamentals", symbol), HISTORY_CACHE_TTL, _fetch)
+
+    async def _fetch_market_data(self, symbol: str, ticker=None) -> Optional[MarketData]:
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            hist = ticker.history(period="2d")
-            
-            if hist.empty or not info:
-                return None
-            
-            current_price = float(hist['Close'].iloc[-1])
-            prev_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+            import yfinance as yf
+
+            ticker = ticker or yf.Ticker(symbol)
+
+            # fast_info hits the lightweight quote endpoint and covers
+            # price, previous close, volume, market cap and the 52-week
+            # range - no ticker.info scrape or 2-day history download on
+            # the quote path. The reads block on HTTP, so they run in a
+            # worker thread and concurrent fetches genuinely overlap.
+            def _quote():
+                fi = ticker.fast_info
+                return (
+                    float(fi.last_price),
+                    float(fi.previous_close or 0.0),
+                    int(fi.last_volume or 0),
+                    fi.market_cap,
+                    fi.year_high,
+                    fi.year_low,
+                )
+
+            (current_price, prev_close, volume,
+             market_cap, year_high, year_low) = await asyncio.to_thread(_quote)
+            prev_close = prev_close or current_price
             price_change = current_price - prev_close
             price_change_percent = (price_change / prev_close * 100) if prev_close != 0 else 0
-            
+
             asset = await self.get_asset_info(symbol)
             if not asset:
                 return None
-            
+
+            info = await self._ticker_fundamentals(symbol, ticker)
+
             return MarketData(
                 asset=asset,
                 current_price=current_price,
                 price_change=price_change,
                 price_change_percent=price_change_percent,
-                volume=int(hist['Volume'].iloc[-1]),
-                market_cap=info.get('marketCap'),
+                volume=volume,
+                market_cap=market_cap,
                 pe_ratio=info.get('trailingPE'),
                 beta=info.get('beta'),
                 dividend_yield=info.get('dividendYield'),
-                fifty_two_week_high=info.get('fiftyTwoWeekHigh'),
-                fifty_two_week_low=info.get('fiftyTwoWeekLow')
+                fifty_two_week_high=year_high,
+                fifty_two_week_low=year_low
             )
-            
+
         except Exception as e:
             print(f"Market data error for {symbol}: {e}")
             return None
@@ -239,52 +457,150 @@ class MarketDataService:
         self,
         symbol: str,
         timeframe: TimeFrame,
-        period: Optional[str] = None
+        period: Optional[str] = None,
+        price_data: Optional[List[PriceData]] = None
     ) -> Optional[TechnicalIndicators]:
-        """Calculate technical indicators"""
+        """Calculate technical indicators.
+
+        Callers that already hold the symbol's bars (the forecast path
+        fetches them anyway) can pass them in, turning this into a pure
+        computation instead of a second yfinance round-trip for the same
+        series. The Redis cache only fronts the fetching path - with bars
+        in hand the compute is cheaper than the cache round-trip.
+        """
         try:
-            price_data = await self.get_historical_data(symbol, timeframe, period)
-            
-            if len(price_data) < 50:  # Need enough data for indicators
+            if price_data is None:
+                # Materialized cache keyed per series; TTL tracks the bar
+                # length so repeated dashboard polls skip the recompute
+                cache_key = f"ind:{symbol}:{getattr(timeframe, 'value', timeframe)}:{period}"
+                ttl = INDICATOR_CACHE_TTL.get(timeframe, 3600)
+                try:
+                    cached = await get_redis().get(cache_key)
+                    if cached is not None:
+                        return pickle.loads(cached)
+                except Exception as e:
+                    print(f"Indicator cache read error for {symbol}: {e}")
+
+                price_data = await self.get_historical_data(symbol, timeframe, period)
+            else:
+                cache_key = None
+
+            n = len(price_data)
+            if n < 50:  # Need enough data for indicators
                 return None
-            
-            # Convert to pandas for calculations
-            df = pd.DataFrame([{
-                'close': p.close,
-                'high': p.high,
-                'low': p.low,
-                'volume': p.volume
-            } for p in price_data])
-            
+
+            # Straight to NumPy - the old pandas DataFrame round-trip built
+            # a dict per bar just to tear it back into columns. float32 is
+            # plenty for display-grade indicator values and halves the
+            # working set.
+            closes = np.fromiter((p.close for p in price_data), dtype=np.float32, count=n)
+            highs = np.fromiter((p.high for p in price_data), dtype=np.float32, count=n)
+            lows = np.fromiter((p.low for p in price_data), dtype=np.float32, count=n)
+            volumes = np.fromiter((p.volume for p in price_data), dtype=np.float32, count=n)
+
             # Calculate indicators
             indicators = TechnicalIndicators()
-            
-            # Simple Moving Averages
-            if len(df) >= 20:
-                indicators.sma20 = float(df['close'].rolling(20).mean().iloc[-1])
-            if len(df) >= 50:
-                indicators.sma50 = float(df['close'].rolling(50).mean().iloc[-1])
-            
-            # RSI
-            if len(df) >= 14:
-                delta = df['close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss
-                indicators.rsi = float(100 - (100 / (1 + rs.iloc[-1])))
-            
+
+            # Scalar kernels (JIT-compiled when numba is present): only the
+            # latest value is served, so skip the full rolling/ewm series
+            if n >= 20:
+                indicators.sma20 = float(sma_last(closes, 20))
+            if n >= 50:
+                indicators.sma50 = float(sma_last(closes, 50))
+
+            # RSI with Wilder smoothing - see _ta_njit.rsi_last
+            if n >= 14:
+                indicators.rsi = float(rsi_last(closes, 14))
+
             # VWAP (simple approximation)
-            if len(df) > 0:
-                typical_price = (df['high'] + df['low'] + df['close']) / 3
-                vwap = (typical_price * df['volume']).sum() / df['volume'].sum()
-                indicators.vwap = float(vwap)
-            
+            total_volume = volumes.sum()
+            if total_volume > 0:
+                typical_price = (highs + lows + closes) / 3
+                indicators.vwap = float((typical_price * volumes).sum() / total_volume)
+
+            if cache_key is not None:
+                try:
+                    await get_redis().setex(cache_key, ttl, pickle.dumps(indicators))
+                except Exception as e:
+                    print(f"Indicator cache write error for {symbol}: {e}")
+
             return indicators
-            
+
         except Exception as e:
             print(f"Technical indicators error for {symbol}: {e}")
             return None
 
-    def __del__(self):
-        if self.session:
-            asyncio.create_task(self.close_session())
+class MarketDataBatcher:
+    """Buffer concurrent market-data lookups into one multi-ticker call.
+
+    Dashboards fire tens of per-symbol market-data requests at once; each
+    one used to be its own yfinance round trip. Requests arriving within
+    settings.BATCH_WINDOW_MS (or until MAX_BATCH symbols queue up) share a
+    single yf.Tickers call and resolve their individual futures from it.
+    """
+
+    MAX_BATCH = 32
+
+    def __init__(self, market_service: MarketDataService):
+        self.market_service = market_service
+        self.window = settings.BATCH_WINDOW_MS / 1000
+        self._queue: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get_market_data(self, symbol: str) -> Optional[MarketData]:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((symbol, future))
+
+        if len(self._queue) >= self.MAX_BATCH:
+            self._flush_now()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        await self._flush()
+
+    def _flush_now(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        asyncio.create_task(self._flush())
+
+    async def _flush(self):
+        batch, self._queue = self._queue, []
+        self._flush_task = None
+
+        if not batch:
+            return
+
+        symbols = list(dict.fromkeys(symbol for symbol, _ in batch))
+        try:
+            import yfinance as yf
+
+            tickers = yf.Tickers(" ".join(symbols)).tickers
+        except Exception as e:
+            print(f"Batched market data error: {e}")
+            tickers = {}
+
+        async def _fetch(symbol: str):
+            ticker = tickers.get(symbol) or tickers.get(symbol.upper())
+            return await self.market_service.get_market_data(symbol, ticker=ticker)
+
+        # Resolve the whole batch concurrently: the blocking yfinance reads
+        # run in worker threads (see _fetch_market_data), so the window's
+        # worth of symbols costs about one round-trip, not N sequential ones
+        results = await asyncio.gather(
+            *(_fetch(symbol) for symbol in symbols), return_exceptions=True
+        )
+        by_symbol = dict(zip(symbols, results))
+
+        for symbol, future in batch:
+            if future.done():
+                continue
+            result = by_symbol[symbol]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,166 +1,321 @@
-from typing import List, Optional
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
 from datetime import datetime, timedelta
 import random
+import numpy as np
 from app.models.schemas import NewsItem, Sentiment, SentimentAnalysis
+from app.core import http
+
+logger = logging.getLogger(__name__)
+
+# Sentiment barely moves within a trading session and not at all outside
+# one, so cache hits are served for 15 minutes during market hours and a
+# day off-hours
+SENTIMENT_TTL_MARKET = 900
+SENTIMENT_TTL_OFF_HOURS = 86400
+
+# The unfiltered list endpoints only vary by timestamp/score jitter, so a
+# one-minute snapshot is plenty fresh
+NEWS_LIST_TTL = 60
+
+# Compact sentiment codes for vectorized tallying
+_SENTIMENT_CODE = {'positive': 0, 'neutral': 1, 'negative': 2}
+
+
+@dataclass(frozen=True, slots=True)
+class NewsTemplate:
+    """One static catalog entry.
+
+    Slotted attribute reads are C-level offsets - the hot loops were
+    paying a dict hash+lookup per field access, plus a fresh default
+    list allocation for every .get('symbols', []).
+    """
+    title: str
+    summary: str
+    source: str
+    sentiment: str
+    symbols: Tuple[str, ...]
+
+
+def _is_market_hours() -> bool:
+    """Rough US-equity session check: 13:30-20:00 UTC, Monday-Friday."""
+    now = datetime.utcnow()
+    if now.weekday() >= 5:
+        return False
+    minutes = now.hour * 60 + now.minute
+    return 13 * 60 + 30 <= minutes < 20 * 60
+
 
 class NewsService:
-    def __init__(self):
+    def __init__(self, http_client=None):
+        # Shared keep-alive pool for real news providers
+        self.http_client = http_client or http.http_client
+        # symbol -> (computed_at, analysis); per-symbol locks coalesce
+        # concurrent misses into one recomputation
+        self._sent_cache: Dict[str, Tuple[float, SentimentAnalysis]] = {}
+        self._sent_locks: Dict[str, asyncio.Lock] = {}
+        # Private generator: skips the random module's global-instance
+        # indirection on every draw under concurrent event-loop load
+        self._rng = random.Random()
+        # Snapshots for the list endpoints: (computed_at, items), misses
+        # coalesced through one lock
+        self._market_cache: Dict[int, Tuple[float, List[NewsItem]]] = {}
+        self._trending_cache: Optional[Tuple[float, List[NewsItem]]] = None
+        self._news_list_lock = asyncio.Lock()
         # Mock news data for demo
-        self.mock_news = [
-            {
-                'title': 'Tech Stocks Rally on AI Optimism',
-                'summary': 'Major technology companies see significant gains as investors bet on artificial intelligence growth prospects.',
-                'source': 'Financial Times',
-                'sentiment': 'positive',
-                'symbols': ['AAPL', 'MSFT', 'GOOGL', 'NVDA']
-            },
-            {
-                'title': 'Federal Reserve Signals Potential Rate Cut',
-                'summary': 'Fed officials hint at possible interest rate reduction in upcoming meeting, boosting market sentiment.',
-                'source': 'Reuters',
-                'sentiment': 'positive',
-                'symbols': ['SPY', 'QQQ']
-            },
-            {
-                'title': 'Oil Prices Surge on Supply Concerns',
-                'summary': 'Crude oil futures jump 3% amid geopolitical tensions and supply chain disruptions.',
-                'source': 'Bloomberg',
-                'sentiment': 'positive',
-                'symbols': ['CL=F', 'XOM', 'CVX']
-            },
-            {
-                'title': 'Bitcoin Volatility Continues Amid Regulatory Uncertainty',
-                'summary': 'Cryptocurrency markets remain volatile as regulators worldwide consider new digital asset policies.',
-                'source': 'CoinDesk',
-                'sentiment': 'neutral',
-                'symbols': ['BTC-USD', 'ETH-USD']
-            },
-            {
-                'title': 'Earnings Season Shows Mixed Results',
-                'summary': 'Q3 earnings reports reveal divergent performance across sectors, with tech leading and retail lagging.',
-                'source': 'Wall Street Journal',
-                'sentiment': 'neutral',
-                'symbols': ['AAPL', 'AMZN', 'WMT', 'TGT']
-            }
-        ]
-    
+        self.mock_news = (
+            NewsTemplate(
+                title='Tech Stocks Rally on AI Optimism',
+                summary='Major technology companies see significant gains as investors bet on artificial intelligence growth prospects.',
+                source='Financial Times',
+                sentiment='positive',
+                symbols=('AAPL', 'MSFT', 'GOOGL', 'NVDA')
+            ),
+            NewsTemplate(
+                title='Federal Reserve Signals Potential Rate Cut',
+                summary='Fed officials hint at possible interest rate reduction in upcoming meeting, boosting market sentiment.',
+                source='Reuters',
+                sentiment='positive',
+                symbols=('SPY', 'QQQ')
+            ),
+            NewsTemplate(
+                title='Oil Prices Surge on Supply Concerns',
+                summary='Crude oil futures jump 3% amid geopolitical tensions and supply chain disruptions.',
+                source='Bloomberg',
+                sentiment='positive',
+                symbols=('CL=F', 'XOM', 'CVX')
+            ),
+            NewsTemplate(
+                title='Bitcoin Volatility Continues Amid Regulatory Uncertainty',
+                summary='Cryptocurrency markets remain volatile as regulators worldwide consider new digital asset policies.',
+                source='CoinDesk',
+                sentiment='neutral',
+                symbols=('BTC-USD', 'ETH-USD')
+            ),
+            NewsTemplate(
+                title='Earnings Season Shows Mixed Results',
+                summary='Q3 earnings reports reveal divergent performance across sectors, with tech leading and retail lagging.',
+                source='Wall Street Journal',
+                sentiment='neutral',
+                symbols=('AAPL', 'AMZN', 'WMT', 'TGT')
+            )
+        )
+        # Inverted indices over the static catalog: a symbol or sentiment
+        # filter visits only the matching items instead of rechecking all
+        self._news_by_symbol: Dict[str, List[int]] = {}
+        self._news_by_sentiment: Dict[str, List[int]] = {}
+        for i, news_data in enumerate(self.mock_news):
+            for sym in news_data.symbols:
+                self._news_by_symbol.setdefault(sym, []).append(i)
+            self._news_by_sentiment.setdefault(news_data.sentiment, []).append(i)
+        # int8 sentiment codes parallel to the catalog: tallying a symbol's
+        # mentions is one np.bincount call over its item indices, which
+        # stays flat if the catalog ever backs onto a real feed with
+        # thousands of items
+        self._sentiment_codes = np.fromiter(
+            (_SENTIMENT_CODE[n.sentiment] for n in self.mock_news),
+            dtype=np.int8,
+            count=len(self.mock_news)
+        )
+
     async def get_news(
         self,
         symbol: Optional[str] = None,
         limit: int = 20,
-        sentiment: Optional[str] = None
+        sentiment: Optional[str] = None,
+        sort_by: Literal['time', 'none'] = 'time'
     ) -> List[NewsItem]:
-        """Get financial news, optionally filtered by symbol or sentiment"""
+        """Get financial news, optionally filtered by symbol or sentiment.
+
+        Callers that re-order the result themselves (trending sorts by
+        relevance) pass sort_by='none' to skip the recency sort.
+        """
         try:
             filtered_news = []
-            
-            for i, news_data in enumerate(self.mock_news):
-                # Filter by symbol if provided
-                if symbol and symbol not in news_data.get('symbols', []):
-                    continue
-                
-                # Filter by sentiment if provided
-                if sentiment and news_data['sentiment'] != sentiment:
+
+            # One clock read per call, and the per-item jitter drawn as a
+            # batch up front instead of two random calls inside the loop
+            now = datetime.now()
+            ts = int(now.timestamp())
+            hours = [self._rng.randint(1, 48) for _ in range(len(self.mock_news))]
+            scores = [self._rng.uniform(0.6, 1.0) for _ in range(len(self.mock_news))]
+
+            # Visit only items the requested symbol/sentiment can match
+            if symbol is not None:
+                indices = self._news_by_symbol.get(symbol, ())
+            elif sentiment is not None:
+                indices = self._news_by_sentiment.get(sentiment, ())
+            else:
+                indices = range(len(self.mock_news))
+
+            for i in indices:
+                news_data = self.mock_news[i]
+
+                # Symbol-selected items may still need the sentiment filter
+                if sentiment and news_data.sentiment != sentiment:
                     continue
-                
+
                 news_item = NewsItem(
-                    id=f"news_{i}_{int(datetime.now().timestamp())}",
-                    title=news_data['title'],
-                    summary=news_data['summary'],
+                    id=f"news_{i}_{ts}",
+                    title=news_data.title,
+                    summary=news_data.summary,
                     url=f"https://example.com/news/{i}",
-                    published_at=datetime.now() - timedelta(hours=random.randint(1, 48)),
-                    source=news_data['source'],
-                    sentiment=Sentiment(news_data['sentiment']),
-                    relevance_score=random.uniform(0.6, 1.0),
-                    symbols=news_data.get('symbols', [])
+                    published_at=now - timedelta(hours=hours[i]),
+                    source=news_data.source,
+                    sentiment=Sentiment(news_data.sentiment),
+                    relevance_score=scores[i],
+                    symbols=list(news_data.symbols)
                 )
-                
+
                 filtered_news.append(news_item)
             
-            # Add some random news if we need more
-            while len(filtered_news) < min(limit, 10):
-                random_news = random.choice(self.mock_news)
-                news_item = NewsItem(
-                    id=f"news_random_{len(filtered_news)}_{int(datetime.now().timestamp())}",
-                    title=f"{random_news['title']} - Market Update",
-                    summary=random_news['summary'],
-                    url=f"https://example.com/news/random/{len(filtered_news)}",
-                    published_at=datetime.now() - timedelta(hours=random.randint(1, 72)),
-                    source=random_news['source'],
-                    sentiment=Sentiment(random_news['sentiment']),
-                    relevance_score=random.uniform(0.5, 0.9),
-                    symbols=random_news.get('symbols', [])
+            # Add some random news if we need more, drawn in one batch
+            # instead of one choice per loop turn
+            needed = min(limit, 10) - len(filtered_news)
+            if needed > 0:
+                start = len(filtered_news)
+                picks = self._rng.choices(self.mock_news, k=needed)
+                filtered_news.extend(
+                    NewsItem(
+                        id=f"news_random_{j}_{ts}",
+                        title=f"{pick.title} - Market Update",
+                        summary=pick.summary,
+                        url=f"https://example.com/news/random/{j}",
+                        published_at=now - timedelta(hours=self._rng.randint(1, 72)),
+                        source=pick.source,
+                        sentiment=Sentiment(pick.sentiment),
+                        relevance_score=self._rng.uniform(0.5, 0.9),
+                        symbols=list(pick.symbols)
+                    )
+                    for j, pick in enumerate(picks, start=start)
                 )
-                filtered_news.append(news_item)
             
             # Sort by published date (newest first)
-            filtered_news.sort(key=lambda x: x.published_at, reverse=True)
+            if sort_by == 'time':
+                filtered_news.sort(key=lambda x: x.published_at, reverse=True)
             
             return filtered_news[:limit]
             
-        except Exception as e:
-            print(f"News service error: {e}")
+        except Exception:
+            logger.exception("News service error")
             return []
     
     async def get_market_news(self, limit: int = 10) -> List[NewsItem]:
-        """Get general market news"""
-        return await self.get_news(limit=limit)
+        """Get general market news (60s snapshot per limit)"""
+        entry = self._market_cache.get(limit)
+        if entry is not None and time.monotonic() - entry[0] < NEWS_LIST_TTL:
+            return entry[1]
+
+        async with self._news_list_lock:
+            entry = self._market_cache.get(limit)
+            if entry is not None and time.monotonic() - entry[0] < NEWS_LIST_TTL:
+                return entry[1]
+
+            items = await self.get_news(limit=limit)
+            self._market_cache[limit] = (time.monotonic(), items)
+            return items
     
     async def get_sentiment_analysis(self, symbol: str) -> Optional[SentimentAnalysis]:
-        """Get sentiment analysis for a specific asset"""
-        try:
-            # Get news for the symbol
-            news_items = await self.get_news(symbol=symbol, limit=50)
-            
-            if not news_items:
-                return None
-            
-            # Calculate sentiment metrics
-            positive_count = sum(1 for item in news_items if item.sentiment == Sentiment.POSITIVE)
-            negative_count = sum(1 for item in news_items if item.sentiment == Sentiment.NEGATIVE)
-            neutral_count = sum(1 for item in news_items if item.sentiment == Sentiment.NEUTRAL)
-            
-            total_mentions = len(news_items)
-            
-            # Calculate overall sentiment
-            sentiment_score = (positive_count - negative_count) / total_mentions if total_mentions > 0 else 0
-            
-            if sentiment_score > 0.2:
-                overall_sentiment = Sentiment.POSITIVE
-            elif sentiment_score < -0.2:
-                overall_sentiment = Sentiment.NEGATIVE
-            else:
-                overall_sentiment = Sentiment.NEUTRAL
-            
-            # Calculate confidence based on volume and consistency
-            confidence = min(1.0, total_mentions / 20) * (1 - abs(sentiment_score - 0.5))
-            
-            return SentimentAnalysis(
-                symbol=symbol,
-                overall_sentiment=overall_sentiment,
-                sentiment_score=sentiment_score,
-                positive_mentions=positive_count,
-                negative_mentions=negative_count,
-                neutral_mentions=neutral_count,
-                confidence=confidence
-            )
-            
-        except Exception as e:
-            print(f"Sentiment analysis error for {symbol}: {e}")
+        """Get sentiment analysis for a specific asset (TTL-cached)"""
+        ttl = SENTIMENT_TTL_MARKET if _is_market_hours() else SENTIMENT_TTL_OFF_HOURS
+
+        entry = self._sent_cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        lock = self._sent_locks.setdefault(symbol, asyncio.Lock())
+        async with lock:
+            # Another waiter may have filled the cache while we queued
+            entry = self._sent_cache.get(symbol)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            result = self._compute_sentiment_analysis(symbol)
+            if result is not None:
+                self._sent_cache[symbol] = (time.monotonic(), result)
+            return result
+
+    async def get_sentiment_analysis_batch(self, symbols: List[str]) -> Dict[str, SentimentAnalysis]:
+        """Sentiment for a whole portfolio in one call.
+
+        Each symbol resolves against the precomputed counts (through the
+        same TTL cache as the single-symbol path), so K symbols cost K
+        dict lookups - not K full news scans. Symbols with no coverage
+        are omitted from the result.
+        """
+        results: Dict[str, SentimentAnalysis] = {}
+        for sym in symbols:
+            analysis = await self.get_sentiment_analysis(sym)
+            if analysis is not None:
+                results[sym] = analysis
+        return results
+
+    def _compute_sentiment_analysis(self, symbol: str) -> Optional[SentimentAnalysis]:
+        # One vectorized tally over the symbol's item indices - no news
+        # list construction, no per-item scanning
+        indices = self._news_by_symbol.get(symbol)
+        if not indices:
             return None
+
+        counts = np.bincount(self._sentiment_codes[indices], minlength=3)
+        positive_count = int(counts[_SENTIMENT_CODE['positive']])
+        neutral_count = int(counts[_SENTIMENT_CODE['neutral']])
+        negative_count = int(counts[_SENTIMENT_CODE['negative']])
+        total_mentions = positive_count + negative_count + neutral_count
+
+        # Calculate overall sentiment
+        sentiment_score = (positive_count - negative_count) / total_mentions if total_mentions > 0 else 0
+
+        if sentiment_score > 0.2:
+            overall_sentiment = Sentiment.POSITIVE
+        elif sentiment_score < -0.2:
+            overall_sentiment = Sentiment.NEGATIVE
+        else:
+            overall_sentiment = Sentiment.NEUTRAL
+
+        # Calculate confidence based on volume and consistency
+        confidence = min(1.0, total_mentions / 20) * (1 - abs(sentiment_score - 0.5))
+
+        return SentimentAnalysis(
+            symbol=symbol,
+            overall_sentiment=overall_sentiment,
+            sentiment_score=sentiment_score,
+            positive_mentions=positive_count,
+            negative_mentions=negative_count,
+            neutral_mentions=neutral_count,
+            confidence=confidence
+        )
     
     async def get_trending_news(self) -> List[NewsItem]:
-        """Get trending financial news"""
+        """Get trending financial news (60s snapshot)"""
+        entry = self._trending_cache
+        if entry is not None and time.monotonic() - entry[0] < NEWS_LIST_TTL:
+            return entry[1]
+
+        async with self._news_list_lock:
+            entry = self._trending_cache
+            if entry is not None and time.monotonic() - entry[0] < NEWS_LIST_TTL:
+                return entry[1]
+
+            items = await self._compute_trending_news()
+            self._trending_cache = (time.monotonic(), items)
+            return items
+
+    async def _compute_trending_news(self) -> List[NewsItem]:
         try:
-            # For demo, return news with high relevance scores
-            all_news = await self.get_news(limit=20)
-            trending = [news for news in all_news if news.relevance_score > 0.8]
-            
-            # Sort by relevance score
-            trending.sort(key=lambda x: x.relevance_score, reverse=True)
-            
-            return trending[:10]
+            # For demo, return news with high relevance scores; partial
+            # sort takes the top 10 in O(N log 10) instead of a full sort
+            all_news = await self.get_news(limit=20, sort_by='none')
+            return heapq.nlargest(
+                10,
+                (news for news in all_news if news.relevance_score > 0.8),
+                key=lambda x: x.relevance_score
+            )
             
-        except Exception as e:
-            print(f"Trending news error: {e}")
+        except Exception:
+            logger.exception("Trending news error")
             return []
@@ -1,6 +1,30 @@
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from app.models.schemas import Strategy, StrategyType, StrategyCategory, RiskLevel
 
+# Symbol-shape patterns, compiled once
+_CRYPTO_RE = re.compile(r'USD$')                  # BTC-USD, BTCUSD
+_FUTURES_RE = re.compile(r'=F')                   # CL=F, GC=F
+_OPTIONS_RE = re.compile(r'^(?=.{6,})(?=.*\d)')   # 6+ chars with a digit (OCC-style)
+
+
+@lru_cache(maxsize=4096)
+def _classify_symbol(symbol: str) -> StrategyType:
+    """Classify a ticker by its shape.
+
+    Symbols repeat heavily across requests, so the LRU turns repeat
+    classification into a dict hit instead of re-running the patterns.
+    """
+    if _CRYPTO_RE.search(symbol):
+        return StrategyType.CRYPTO
+    if _FUTURES_RE.search(symbol):
+        return StrategyType.FUTURES
+    if _OPTIONS_RE.match(symbol):
+        return StrategyType.OPTIONS
+    return StrategyType.EQUITY
+
+
 class StrategyService:
     def __init__(self):
         # Predefined strategies for demo
@@ -110,7 +134,37 @@ class StrategyService:
                 avg_return=11.3
             )
         ]
-    
+        # ID lookups happen on every forecast/backtest; hash instead of scan
+        self._by_id = {s.id: s for s in self.strategies}
+        # Immutable snapshot for the common "list everything" path, so the
+        # internal catalog list is never handed to callers who may mutate it
+        self._all = tuple(self.strategies)
+        # Inverted indices: filter value -> strategy ids, so get_strategies
+        # intersects small sets instead of re-scanning the catalog once per
+        # supplied filter. Keyed by enum member - inputs are resolved to
+        # members once, so lookups hash a singleton instead of comparing
+        # strings per strategy.
+        self._ids_by_type: Dict[StrategyType, Set[str]] = {}
+        self._ids_by_risk: Dict[RiskLevel, Set[str]] = {}
+        self._ids_by_category: Dict[StrategyCategory, Set[str]] = {}
+        for s in self.strategies:
+            self._ids_by_type.setdefault(s.type, set()).add(s.id)
+            self._ids_by_risk.setdefault(s.risk_level, set()).add(s.id)
+            self._ids_by_category.setdefault(s.category, set()).add(s.id)
+        # Compatible-strategy lists are fully determined by asset type:
+        # type matches plus the equity strategies for non-crypto. Compute
+        # them once instead of rebuilding and deduping per symbol (the old
+        # set()-of-models dedupe also relied on model hashability).
+        self._compat_by_asset_type: Dict[StrategyType, List[Strategy]] = {}
+        equity_strategies = [s for s in self.strategies if s.type == StrategyType.EQUITY]
+        for asset_type in StrategyType:
+            compatible = [s for s in self.strategies if s.type == asset_type]
+            if asset_type != StrategyType.CRYPTO:
+                compatible.extend(equity_strategies)
+            # Dict keyed by id: dedupes in one pass with insertion order
+            # preserved, so the output (and any downstream ETag) is stable
+            self._compat_by_asset_type[asset_type] = list({s.id: s for s in compatible}.values())
+
     async def get_strategies(
         self,
         asset_type: Optional[str] = None,
@@ -118,44 +172,35 @@ class StrategyService:
         category: Optional[str] = None
     ) -> List[Strategy]:
         """Get filtered list of strategies"""
-        filtered_strategies = self.strategies
-        
-        if asset_type:
-            filtered_strategies = [s for s in filtered_strategies if s.type.value == asset_type]
-        
-        if risk_level:
-            filtered_strategies = [s for s in filtered_strategies if s.risk_level.value == risk_level]
-        
-        if category:
-            filtered_strategies = [s for s in filtered_strategies if s.category.value == category]
-        
-        return filtered_strategies
+        # Resolve filter strings to enum members once up front; an unknown
+        # value can't match anything
+        try:
+            filters = []
+            if asset_type:
+                filters.append((StrategyType(asset_type), self._ids_by_type))
+            if risk_level:
+                filters.append((RiskLevel(risk_level), self._ids_by_risk))
+            if category:
+                filters.append((StrategyCategory(category), self._ids_by_category))
+        except ValueError:
+            return []
+
+        selected: Optional[Set[str]] = None
+        for member, index in filters:
+            ids = index.get(member, set())
+            selected = ids if selected is None else selected & ids
+
+        if selected is None:
+            return list(self._all)
+
+        # Membership test against the intersected set, in catalog order
+        return [s for s in self.strategies if s.id in selected]
     
     async def get_strategy(self, strategy_id: str) -> Optional[Strategy]:
         """Get a specific strategy by ID"""
-        for strategy in self.strategies:
-            if strategy.id == strategy_id:
-                return strategy
-        return None
+        return self._by_id.get(strategy_id)
     
     async def get_compatible_strategies(self, symbol: str) -> List[Strategy]:
         """Get strategies compatible with a specific asset"""
-        # Determine asset type from symbol
-        asset_type = StrategyType.EQUITY  # default
-        
-        if symbol.endswith('-USD') or symbol.endswith('USD'):
-            asset_type = StrategyType.CRYPTO
-        elif '=F' in symbol:
-            asset_type = StrategyType.FUTURES
-        elif len(symbol) > 5 and any(char.isdigit() for char in symbol):
-            asset_type = StrategyType.OPTIONS
-        
-        # Return strategies compatible with the asset type
-        compatible = [s for s in self.strategies if s.type == asset_type]
-        
-        # Also include equity strategies for most assets
-        if asset_type != StrategyType.CRYPTO:
-            equity_strategies = [s for s in self.strategies if s.type == StrategyType.EQUITY]
-            compatible.extend(equity_strategies)
-        
-        return list(set(compatible))  # Remove duplicates
+        # Precomputed per asset type
+        return self._compat_by_asset_type[_classify_symbol(symbol)]